@@ -31,6 +31,7 @@ __version__ = "2.0.0"
 from .core import (
     CircularDependencyError,
     DependencyError,
+    DependencyErrorKind,
     FileStateStore,
     LoaderError,
     MemoryStateStore,
@@ -51,7 +52,7 @@ from .dependency import DependencyGraph, DependencyResolver
 from .lifecycle import LifecycleManager
 
 # 加载器
-from .loader import FileSystemLoader, ModuleLoader
+from .loader import FileSystemLoader, MemoryLoader, ModuleLoader
 
 # 主管理器
 from .manager import ModuleManager
@@ -67,6 +68,7 @@ __all__ = [
     "ModuleError",
     "CircularDependencyError",
     "DependencyError",
+    "DependencyErrorKind",
     "LoaderError",
     "ModuleNotFoundError",
     "ModuleStateError",
@@ -82,5 +84,6 @@ __all__ = [
     "DependencyResolver",
     "ModuleLoader",
     "FileSystemLoader",
+    "MemoryLoader",
     "LifecycleManager",
 ]
@@ -6,6 +6,7 @@
 from .exceptions import (
     CircularDependencyError,
     DependencyError,
+    DependencyErrorKind,
     LoaderError,
     ModuleError,
     ModuleNotFoundError,
@@ -31,6 +32,7 @@ __all__ = [
     "ModuleError",
     "CircularDependencyError",
     "DependencyError",
+    "DependencyErrorKind",
     "LoaderError",
     "ModuleNotFoundError",
     "ModuleStateError",
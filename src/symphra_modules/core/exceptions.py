@@ -5,6 +5,27 @@
 
 from __future__ import annotations
 
+from enum import IntEnum
+from typing import Any, ClassVar, Final
+
+# 异常消息中的固定片段（模块级常量，避免每次抛出时重复格式化）
+_CYCLE_PREFIX: Final = "检测到循环依赖: "
+_CYCLE_HINT: Final = "\n请检查模块的 dependencies 配置，确保没有循环引用"
+_MISSING_DEPS_HINT: Final = "\n请确保所有依赖模块都已正确安装和配置"
+_DEPS_SEPARATOR: Final = "、"
+_CYCLE_SEPARATOR: Final = " -> "
+
+
+class DependencyErrorKind(IntEnum):
+    """依赖错误种类.
+
+    调用方可以按错误码区分依赖错误，无需解析错误消息。
+    """
+
+    CYCLE = 1  # 循环依赖
+    MISSING = 2  # 依赖项不存在
+    NOT_FOUND = 3  # 模块本身不存在
+
 
 class ModuleError(Exception):
     """模块系统基础异常."""
@@ -18,6 +39,8 @@ class CircularDependencyError(ModuleError):
     当检测到模块间存在循环依赖时抛出此异常。
     """
 
+    kind: ClassVar[DependencyErrorKind] = DependencyErrorKind.CYCLE
+
     def __init__(self, cycle: list[str]) -> None:
         """初始化循环依赖异常.
 
@@ -25,10 +48,21 @@ class CircularDependencyError(ModuleError):
             cycle: 循环依赖的模块列表
         """
         self.cycle = cycle
-        cycle_str = " -> ".join(cycle)
-        msg = f"检测到循环依赖: {cycle_str}\n"
-        msg += "请检查模块的 dependencies 配置，确保没有循环引用"
-        super().__init__(msg)
+        # 构造时拼接一次，format_cycle 和错误消息共用
+        self._formatted = _CYCLE_SEPARATOR.join(cycle)
+        super().__init__(_CYCLE_PREFIX + self._formatted + _CYCLE_HINT)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """按构造参数重建异常（默认实现会把格式化后的消息当作 cycle 传入）."""
+        return (type(self), (self.cycle,), self.__dict__)
+
+    def format_cycle(self) -> str:
+        """返回格式化的循环路径.
+
+        Returns:
+            形如 ``"a -> b -> a"`` 的字符串
+        """
+        return self._formatted
 
 
 class DependencyError(ModuleError):
@@ -45,17 +79,37 @@ class DependencyError(ModuleError):
             missing_deps: 缺失的依赖列表
         """
         self.module_name = module_name
-        self.missing_deps = missing_deps or []
+        # 空列表延迟到首次访问时再创建，常见的无缺失依赖路径不分配列表
+        self._missing_deps = missing_deps or None
 
-        if self.missing_deps:
-            deps_str = "、".join(self.missing_deps)
-            msg = f"模块 '{module_name}' 的依赖项不存在: {deps_str}\n"
-            msg += "请确保所有依赖模块都已正确安装和配置"
+        if missing_deps:
+            deps_str = _DEPS_SEPARATOR.join(missing_deps)
+            msg = f"模块 '{module_name}' 的依赖项不存在: {deps_str}" + _MISSING_DEPS_HINT
         else:
             msg = f"模块 '{module_name}' 存在依赖错误"
 
         super().__init__(msg)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """按构造参数重建异常（默认实现会把格式化后的消息当作 module_name 传入）."""
+        return (type(self), (self.module_name, self._missing_deps), self.__dict__)
+
+    @property
+    def kind(self) -> DependencyErrorKind:
+        """错误种类：有缺失依赖时为 MISSING，否则为 NOT_FOUND."""
+        return DependencyErrorKind.MISSING if self._missing_deps else DependencyErrorKind.NOT_FOUND
+
+    @property
+    def missing_deps(self) -> list[str]:
+        """缺失的依赖列表（未提供时在首次访问时创建空列表）."""
+        if self._missing_deps is None:
+            self._missing_deps = []
+        return self._missing_deps
+
+    @missing_deps.setter
+    def missing_deps(self, value: list[str]) -> None:
+        self._missing_deps = value
+
 
 class ModuleNotFoundError(ModuleError):
     """模块未找到异常.
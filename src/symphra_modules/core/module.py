@@ -6,12 +6,16 @@
 from __future__ import annotations
 
 import inspect
+import time
 from abc import ABC
 from datetime import datetime
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from .state import ModuleState
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class Module(ABC):
     """模块基类 - 简洁优雅的设计.
@@ -41,7 +45,9 @@ class Module(ABC):
     def __init__(self) -> None:
         """初始化模块实例."""
         self._state = ModuleState.LOADED
-        self._loaded_at = datetime.now()
+        # 只记录整数纳秒时间戳，datetime 在首次访问 loaded_at 时再构造
+        self._loaded_at_ns = time.time_ns()
+        self._loaded_at: datetime | None = None
 
     def bootstrap(self) -> None:
         """Bootstrap 模块 - 子类可覆盖.
@@ -88,7 +94,12 @@ class Module(ABC):
 
     @property
     def loaded_at(self) -> datetime:
-        """获取模块加载时间."""
+        """获取模块加载时间（本地时间，精确到微秒）."""
+        if self._loaded_at is None:
+            seconds, nanoseconds = divmod(self._loaded_at_ns, 1_000_000_000)
+            self._loaded_at = datetime.fromtimestamp(seconds).replace(
+                microsecond=nanoseconds // 1000
+            )
         return self._loaded_at
 
     def __repr__(self) -> str:
@@ -96,7 +107,9 @@ class Module(ABC):
         return f"<{self.__class__.__name__}(name={self.name}, state={self.state.value})>"
 
 
-def is_async_module(module: Module) -> bool:
+def is_async_module(
+    module: Module, *, _source_reader: Callable[[Any], str] = inspect.getsource
+) -> bool:
     """检查模块是否支持异步方法.
 
     判断标准：
@@ -106,6 +119,7 @@ def is_async_module(module: Module) -> bool:
 
     Args:
         module: 模块实例
+        _source_reader: 读取方法源码的函数（内部使用，默认 inspect.getsource，便于测试替换）
 
     Returns:
         如果是真正的异步模块返回 True，否则返回 False
@@ -126,8 +140,8 @@ def is_async_module(module: Module) -> bool:
 
     # 简单检查：如果方法的源码中包含对同步方法的调用，则认为是默认实现
     try:
-        start_async_source = inspect.getsource(start_async_method)
-        stop_async_source = inspect.getsource(stop_async_method)
+        start_async_source = _source_reader(start_async_method)
+        stop_async_source = _source_reader(stop_async_method)
 
         # 如果异步方法中调用了同步方法，则认为是默认实现
         is_default_start = "self.start()" in start_async_source
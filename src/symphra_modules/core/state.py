@@ -32,33 +32,47 @@ class ModuleState(Enum):
 
 
 # 状态转换规则（用于验证状态转换的合法性）
-VALID_TRANSITIONS: dict[ModuleState, set[ModuleState]] = {
+# 目标集合为不可变的 frozenset：下方的位掩码在导入时由此表生成，运行时不应再修改
+VALID_TRANSITIONS: dict[ModuleState, frozenset[ModuleState]] = {
     # 从 DISCOVERED 可以安装
-    ModuleState.DISCOVERED: {ModuleState.INSTALLED},
+    ModuleState.DISCOVERED: frozenset({ModuleState.INSTALLED}),
     # 从 INSTALLED 可以初始化、加载、禁用或卸载
-    ModuleState.INSTALLED: {
-        ModuleState.INITIALIZED,
-        ModuleState.LOADED,
-        ModuleState.DISABLED,
-        ModuleState.UNINSTALLED,
-    },
+    ModuleState.INSTALLED: frozenset(
+        {
+            ModuleState.INITIALIZED,
+            ModuleState.LOADED,
+            ModuleState.DISABLED,
+            ModuleState.UNINSTALLED,
+        }
+    ),
     # 从 DISABLED 可以重新启用或卸载
-    ModuleState.DISABLED: {ModuleState.INSTALLED, ModuleState.UNINSTALLED},
+    ModuleState.DISABLED: frozenset({ModuleState.INSTALLED, ModuleState.UNINSTALLED}),
     # 从 INITIALIZED 可以启动或禁用
-    ModuleState.INITIALIZED: {ModuleState.STARTED, ModuleState.DISABLED},
+    ModuleState.INITIALIZED: frozenset({ModuleState.STARTED, ModuleState.DISABLED}),
     # 从 LOADED 可以初始化（bootstrap）、启动、停止或禁用
-    ModuleState.LOADED: {
-        ModuleState.INITIALIZED,
-        ModuleState.STARTED,
-        ModuleState.STOPPED,
-        ModuleState.DISABLED,
-    },
+    ModuleState.LOADED: frozenset(
+        {
+            ModuleState.INITIALIZED,
+            ModuleState.STARTED,
+            ModuleState.STOPPED,
+            ModuleState.DISABLED,
+        }
+    ),
     # 从 STARTED 可以停止或禁用
-    ModuleState.STARTED: {ModuleState.STOPPED, ModuleState.DISABLED},
+    ModuleState.STARTED: frozenset({ModuleState.STOPPED, ModuleState.DISABLED}),
     # 从 STOPPED 可以重新启动或禁用
-    ModuleState.STOPPED: {ModuleState.STARTED, ModuleState.DISABLED},
+    ModuleState.STOPPED: frozenset({ModuleState.STARTED, ModuleState.DISABLED}),
     # UNINSTALLED 是终态，不能转换到其他状态
-    ModuleState.UNINSTALLED: set(),
+    ModuleState.UNINSTALLED: frozenset(),
+}
+
+# 每个状态对应一个比特位（ModuleState 的值是字符串，因此按定义顺序编号）
+_STATE_BITS: dict[ModuleState, int] = {state: 1 << index for index, state in enumerate(ModuleState)}
+
+# 每个源状态允许的目标状态位掩码，导入时构建一次，校验时只需一次查表和一次按位与
+_TRANSITION_MASKS: dict[ModuleState, int] = {
+    state: sum(_STATE_BITS[target] for target in VALID_TRANSITIONS.get(state, ()))
+    for state in ModuleState
 }
 
 
@@ -72,7 +86,7 @@ def is_valid_transition(from_state: ModuleState, to_state: ModuleState) -> bool:
     Returns:
         如果转换有效返回 True，否则返回 False
     """
-    return to_state in VALID_TRANSITIONS.get(from_state, set())
+    return bool(_TRANSITION_MASKS.get(from_state, 0) & _STATE_BITS.get(to_state, 0))
 
 
 def get_state_description(state: ModuleState) -> str:
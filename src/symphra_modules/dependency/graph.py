@@ -6,13 +6,18 @@
 
 from __future__ import annotations
 
+import sys
 import threading
+from collections import deque
 from typing import TYPE_CHECKING
 
 from ..core.exceptions import CircularDependencyError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+
+# 三色 DFS 标记：未访问 / 在当前路径上 / 已完成
+_WHITE, _GRAY, _BLACK = 0, 1, 2
 
 
 class DependencyGraph:
@@ -27,23 +32,40 @@ class DependencyGraph:
     时间复杂度: O(V + E)，其中 V 是节点数，E 是边数
     """
 
+    __slots__ = ("_nodes", "_dependents", "_lock", "_version", "_cached_sort", "_frozen_deps")
+
     def __init__(self) -> None:
         """初始化依赖图."""
         # 存储节点及其依赖关系: {节点名: {依赖节点集合}}
         self._nodes: dict[str, set[str]] = {}
+        # 反向索引，随增删节点增量维护: {节点名: {直接依赖它的节点集合}}
+        self._dependents: dict[str, set[str]] = {}
         # 线程锁，保护共享状态
         self._lock = threading.RLock()
-        # 缓存拓扑排序结果
-        self._cached_sort: list[str] | None = None
-        self._dirty = True
+        # 结构版本号，每次修改图时单调递增
+        self._version = 0
+        # 缓存拓扑排序结果: (计算时的版本号, 排序结果)
+        self._cached_sort: tuple[int, list[str]] | None = None
+        # 缓存各节点依赖的不可变快照，修改图时清空
+        self._frozen_deps: dict[str, frozenset[str]] = {}
+
+    @property
+    def version(self) -> int:
+        """依赖图的结构版本号（每次添加/移除节点或清空后递增）."""
+        return self._version
 
     def add_node(self, name: str, dependencies: Sequence[str]) -> None:
         """添加节点及其依赖关系.
 
+        节点名与依赖名都会经过 ``sys.intern`` 驻留，后续的字典/集合查找可以
+        先走身份比较的快速路径。
+
         Args:
             name: 节点名称
             dependencies: 依赖的节点列表
         """
+        name = sys.intern(name)
+        dependencies = [sys.intern(dep) for dep in dependencies]
         with self._lock:
             # 确保当前节点在图中
             if name not in self._nodes:
@@ -52,13 +74,38 @@ class DependencyGraph:
             # 添加依赖关系
             self._nodes[name].update(dependencies)
 
-            # 确保依赖节点也在图中
+            # 确保依赖节点也在图中，并登记反向依赖
             for dep in dependencies:
                 if dep not in self._nodes:
                     self._nodes[dep] = set()
+                self._dependents.setdefault(dep, set()).add(name)
+
+            # 递增版本号，使缓存失效
+            self._version += 1
+            self._frozen_deps.clear()
+
+    def add_nodes(self, nodes: Iterable[tuple[str, Sequence[str]]]) -> None:
+        """批量添加节点及其依赖关系.
+
+        整批只获取一次锁、只递增一次版本号；循环依赖检测留给随后的
+        一次 ``topological_sort``，而不是每插入一个节点检查一次。
 
-            # 标记缓存为脏
-            self._dirty = True
+        Args:
+            nodes: (节点名称, 依赖的节点列表) 的可迭代对象
+        """
+        with self._lock:
+            for name, dependencies in nodes:
+                name = sys.intern(name)
+                node_deps = self._nodes.setdefault(name, set())
+                for dep in dependencies:
+                    dep = sys.intern(dep)
+                    node_deps.add(dep)
+                    self._nodes.setdefault(dep, set())
+                    self._dependents.setdefault(dep, set()).add(name)
+
+            # 整批只递增一次版本号
+            self._version += 1
+            self._frozen_deps.clear()
 
     def remove_node(self, name: str) -> None:
         """移除节点.
@@ -67,22 +114,32 @@ class DependencyGraph:
             name: 节点名称
         """
         with self._lock:
-            if name in self._nodes:
-                # 移除节点
-                del self._nodes[name]
-
-                # 移除所有对此节点的依赖
-                for node_deps in self._nodes.values():
+            # 一次 pop 同时完成存在性检查和删除
+            deps = self._nodes.pop(name, None)
+            if deps is None:
+                return
+
+            # 从它所依赖节点的反向索引中移除自己
+            for dep in deps:
+                dependents = self._dependents.get(dep)
+                if dependents is not None:
+                    dependents.discard(name)
+
+            # 按反向索引只更新依赖此节点的节点，无需扫描整张图
+            for dependent in self._dependents.pop(name, ()):
+                node_deps = self._nodes.get(dependent)
+                if node_deps is not None:
                     node_deps.discard(name)
 
-                # 标记缓存为脏
-                self._dirty = True
+            # 递增版本号，使缓存失效
+            self._version += 1
+            self._frozen_deps.clear()
 
     def topological_sort(self) -> list[str]:
         """执行拓扑排序 - Kahn 算法.
 
         使用 Kahn 算法进行拓扑排序，确保依赖关系正确。
-        结果会被缓存，除非依赖图被修改。
+        结果按结构版本号缓存，依赖图未被修改时直接返回缓存。
 
         Returns:
             排序后的节点列表
@@ -91,57 +148,138 @@ class DependencyGraph:
             CircularDependencyError: 存在循环依赖
         """
         with self._lock:
-            # 如果缓存有效，直接返回
-            if not self._dirty and self._cached_sort is not None:
-                return self._cached_sort.copy()
+            # 如果缓存的版本与当前版本一致，直接返回
+            if self._cached_sort is not None and self._cached_sort[0] == self._version:
+                return self._cached_sort[1].copy()
 
-            # 构建邻接表和入度表
-            # adj_list[node] 表示依赖于 node 的节点集合
+            # 邻接表直接使用增量维护的反向索引（dep -> 依赖它的节点）
             # in_degree[node] 表示 node 的入度（node 依赖的节点数）
-            adj_list: dict[str, set[str]] = {node: set() for node in self._nodes}
-            in_degree: dict[str, int] = dict.fromkeys(self._nodes, 0)
-
-            # 构建邻接表和计算入度
-            for node in self._nodes:
-                for dep in self._nodes[node]:
-                    # node 依赖于 dep
-                    # 所以添加边 dep -> node
-                    adj_list[dep].add(node)
-                    in_degree[node] += 1
+            adj_list = self._dependents
+            in_degree: dict[str, int] = {node: len(deps) for node, deps in self._nodes.items()}
 
             # 入度为 0 的节点入队（没有依赖或依赖已处理完）
-            queue = [node for node, degree in in_degree.items() if degree == 0]
+            queue = deque(node for node, degree in in_degree.items() if degree == 0)
             result: list[str] = []
 
             while queue:
-                # 取出入度为 0 的节点（可以执行的节点）
-                current = queue.pop(0)
+                # 取出入度为 0 的节点（可以执行的节点），popleft 为 O(1)
+                current = queue.popleft()
                 result.append(current)
 
                 # 更新依赖于当前节点的节点的入度
-                for neighbor in adj_list[current]:
+                for neighbor in adj_list.get(current, ()):
                     in_degree[neighbor] -= 1
                     if in_degree[neighbor] == 0:
                         queue.append(neighbor)
 
             # 检测循环依赖
             if len(result) != len(self._nodes):
-                # 找到未处理的节点（存在循环依赖）
-                remaining = list(set(self._nodes.keys()) - set(result))
-                raise CircularDependencyError(remaining)
+                # 优先报告具体的环路径，找不到时退回未处理的节点
+                cycle = self.find_cycle() or list(set(self._nodes.keys()) - set(result))
+                raise CircularDependencyError(cycle)
 
             # 缓存结果
-            self._cached_sort = result.copy()
-            self._dirty = False
+            self._cached_sort = (self._version, result.copy())
 
             return result
 
+    def find_cycle(self) -> list[str] | None:
+        """查找一个循环依赖 - 三色标记的迭代式 DFS.
+
+        遇到第一条回边（指向当前路径上节点的边）即返回，无需完成整个拓扑排序。
+
+        Returns:
+            首尾相同的环路径（如 ``["a", "b", "a"]``），无环时返回 None
+        """
+        with self._lock:
+            color = dict.fromkeys(self._nodes, _WHITE)
+            for root in self._nodes:
+                if color[root] != _WHITE:
+                    continue
+
+                color[root] = _GRAY
+                path = [root]
+                stack = [iter(self._nodes[root])]
+                while stack:
+                    for dep in stack[-1]:
+                        if color[dep] == _GRAY:
+                            # 回边：从路径中截取环
+                            return path[path.index(dep) :] + [dep]
+                        if color[dep] == _WHITE:
+                            color[dep] = _GRAY
+                            path.append(dep)
+                            stack.append(iter(self._nodes[dep]))
+                            break
+                    else:
+                        # 当前节点的依赖已全部处理完
+                        color[path.pop()] = _BLACK
+                        stack.pop()
+
+            return None
+
+    def would_create_cycle(self, name: str, dependency: str) -> list[str] | None:
+        """检查新增依赖边 ``name -> dependency`` 是否会形成循环依赖.
+
+        只从 ``dependency`` 出发沿依赖边做 BFS，探测能否到达 ``name``，
+        遍历范围限于可达子图，无需对整张图重新排序。
+
+        Args:
+            name: 将要新增依赖的节点
+            dependency: 新增的依赖节点
+
+        Returns:
+            会形成的环路径（如 ``["a", "b", "c", "a"]``），不会成环时返回 None
+        """
+        with self._lock:
+            # parents[节点] = BFS 中到达它的前一个节点
+            parents: dict[str, str | None] = {dependency: None}
+            queue = deque([dependency])
+            while queue:
+                current = queue.popleft()
+                if current == name:
+                    # 回溯出 dependency -> ... -> name 的路径
+                    path: list[str] = []
+                    node: str | None = current
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    path.reverse()
+                    return [name, *path]
+                for dep in self._nodes.get(current, ()):
+                    if dep not in parents:
+                        parents[dep] = current
+                        queue.append(dep)
+
+            return None
+
+    def copy(self) -> DependencyGraph:
+        """复制依赖图（仅复制结构）.
+
+        逐节点复制依赖集合，新图与原图互不影响；不使用 ``copy.deepcopy``，
+        因为节点名是不可变字符串，且图中持有的锁无法被深拷贝。
+
+        Returns:
+            新的依赖图实例
+        """
+        new_graph = DependencyGraph()
+        with self._lock:
+            new_graph._nodes = {name: deps.copy() for name, deps in self._nodes.items()}
+            new_graph._dependents = {
+                name: dependents.copy() for name, dependents in self._dependents.items()
+            }
+            new_graph._version = self._version
+            if self._cached_sort is not None and self._cached_sort[0] == self._version:
+                new_graph._cached_sort = (self._version, self._cached_sort[1].copy())
+        return new_graph
+
     def clear(self) -> None:
         """清空依赖图."""
         with self._lock:
             self._nodes.clear()
+            self._dependents.clear()
             self._cached_sort = None
-            self._dirty = True
+            self._frozen_deps.clear()
+            self._version += 1
 
     def has_node(self, name: str) -> bool:
         """检查节点是否存在.
@@ -155,17 +293,70 @@ class DependencyGraph:
         with self._lock:
             return name in self._nodes
 
-    def get_dependencies(self, name: str) -> set[str]:
+    def get_dependencies(self, name: str) -> frozenset[str]:
         """获取节点的直接依赖.
 
+        返回缓存的不可变快照，多次调用共享同一对象，无需防御性复制；
+        图被修改后缓存失效。
+
+        Args:
+            name: 节点名称
+
+        Returns:
+            依赖节点的不可变集合
+        """
+        with self._lock:
+            frozen = self._frozen_deps.get(name)
+            if frozen is None:
+                deps = self._nodes.get(name)
+                if deps is None:
+                    return frozenset()
+                frozen = self._frozen_deps[name] = frozenset(deps)
+            return frozen
+
+    def get_dependents(self, name: str) -> frozenset[str]:
+        """获取直接依赖该节点的节点.
+
+        直接读取增量维护的反向索引，无需扫描整张图。
+
+        Args:
+            name: 节点名称
+
+        Returns:
+            直接依赖该节点的节点的不可变集合
+        """
+        with self._lock:
+            return frozenset(self._dependents.get(name, ()))
+
+    def get_reverse_dependencies(self, name: str) -> dict[str, set[str]]:
+        """获取节点的传递反向依赖（所有直接或间接依赖它的节点）.
+
+        沿增量维护的反向索引从起点做迭代式 BFS，只访问可达部分，
+        每条边只访问一次。
+
         Args:
             name: 节点名称
 
         Returns:
-            依赖节点的集合
+            {节点名: 直接依赖该节点的节点集合}，只包含从起点可达且存在依赖者的节点
         """
+        result: dict[str, set[str]] = {}
+        seen = {name}
+        queue = deque([name])
         with self._lock:
-            return self._nodes.get(name, set()).copy()
+            while queue:
+                current = queue.popleft()
+                dependents = self._dependents.get(current)
+                if not dependents:
+                    continue
+                # 返回副本，调用方修改结果不影响反向索引
+                result[current] = dependents.copy()
+                for dependent in dependents:
+                    if dependent not in seen:
+                        seen.add(dependent)
+                        queue.append(dependent)
+
+        return result
 
     def get_all_nodes(self) -> list[str]:
         """获取所有节点名称.
@@ -6,14 +6,20 @@
 
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING
 
-from ..core.exceptions import CircularDependencyError, DependencyError
+from ..core.exceptions import DependencyError
 from .graph import DependencyGraph
 
 if TYPE_CHECKING:
+    from typing import TypeAlias
+
     from ..core.module import Module
 
+    # 缓存的可达节点: (模块名称, 解析时读取的模块类, 依赖元组)
+    _Node: TypeAlias = tuple[str, type[Module], tuple[str, ...]]
+
 
 class DependencyResolver:
     """依赖解析器.
@@ -25,13 +31,26 @@ class DependencyResolver:
     - 验证依赖完整性
     """
 
+    __slots__ = ("_graph", "_load_orders")
+
     def __init__(self) -> None:
         """初始化依赖解析器."""
         self._graph = DependencyGraph()
+        # 加载顺序缓存: {模块名: (写入时的依赖图版本号, 可达节点, 加载顺序)}
+        self._load_orders: dict[str, tuple[int, list[_Node], list[str]]] = {}
+
+    def invalidate(self) -> None:
+        """清空加载顺序缓存（只释放内存，不影响解析结果的正确性）."""
+        self._load_orders.clear()
 
     def resolve(self, module_name: str, available_modules: dict[str, type[Module]]) -> list[str]:
         """解析模块依赖并返回加载顺序.
 
+        结果按模块名缓存，缓存中记录了解析时读取的模块类及其 ``dependencies``；
+        命中时先逐个核对它们与当前 ``available_modules`` 一致，因此原地修改模块表
+        （增删模块、替换模块类或修改依赖）后无需手动失效。核对通过时跳过拓扑排序，
+        只在依赖图已被其他解析覆盖时用缓存的节点重建依赖图。失败的解析不会被缓存。
+
         Args:
             module_name: 要解析的模块名称
             available_modules: 所有可用的模块类 {name: class}
@@ -43,65 +62,80 @@ class DependencyResolver:
             DependencyError: 依赖缺失
             CircularDependencyError: 循环依赖
         """
-        # 清空旧的依赖图
+        cached = self._load_orders.get(module_name)
+        if cached is not None and self._is_current(cached[1], available_modules):
+            version, nodes, order = cached
+            if self._graph.version != version:
+                # 依赖图当前保存的是其他模块的子图，按缓存的节点重建
+                self._graph.clear()
+                self._graph.add_nodes((name, deps) for name, _, deps in nodes)
+                self._load_orders[module_name] = (self._graph.version, nodes, order)
+            return order.copy()
+
+        # 先收集可达子图并检查缺失依赖，再整批写入依赖图
+        nodes = self._collect_nodes(module_name, available_modules)
         self._graph.clear()
+        self._graph.add_nodes((name, deps) for name, _, deps in nodes)
 
-        # 递归构建依赖图
-        self._build_graph(module_name, available_modules, set())
-
-        # 返回拓扑排序结果
-        try:
-            return self._graph.topological_sort()
-        except CircularDependencyError:
-            raise
+        # Kahn 拓扑排序，输出节点数不足时抛出 CircularDependencyError
+        order = self._graph.topological_sort()
+        self._load_orders[module_name] = (self._graph.version, nodes, order.copy())
+        return order
 
-    def _build_graph(
-        self,
-        module_name: str,
-        available_modules: dict[str, type[Module]],
-        visiting: set[str],
-    ) -> None:
-        """递归构建依赖图.
+    @staticmethod
+    def _is_current(nodes: list[_Node], available_modules: dict[str, type[Module]]) -> bool:
+        """检查缓存的节点是否仍与模块表一致（同一模块类、相同依赖）.
 
         Args:
-            module_name: 当前模块名称
-            available_modules: 所有可用的模块类
-            visiting: 当前访问路径中的节点集合（用于检测循环）
+            nodes: 缓存的可达节点
+            available_modules: 当前的可用模块表
 
-        Raises:
-            DependencyError: 依赖缺失
-            CircularDependencyError: 循环依赖
+        Returns:
+            全部一致返回 True
         """
-        # 检查模块是否存在
-        if module_name not in available_modules:
-            raise DependencyError(module_name=module_name, missing_deps=[])
-
-        # 检测循环依赖
-        if module_name in visiting:
-            cycle = list(visiting) + [module_name]
-            raise CircularDependencyError(cycle)
-
-        # 获取模块的依赖
-        module_class = available_modules[module_name]
-        dependencies = getattr(module_class, "dependencies", [])
+        for name, module_class, dependencies in nodes:
+            if available_modules.get(name) is not module_class:
+                return False
+            if tuple(getattr(module_class, "dependencies", ())) != dependencies:
+                return False
+        return True
 
-        # 添加到依赖图（如果还没有添加）
-        if not self._graph.has_node(module_name):
-            self._graph.add_node(module_name, dependencies)
+    @staticmethod
+    def _collect_nodes(module_name: str, available_modules: dict[str, type[Module]]) -> list[_Node]:
+        """从目标模块出发做迭代式 BFS，收集所有可达模块及其依赖.
 
-        # 标记当前节点为正在访问
-        visiting.add(module_name)
+        每个模块只访问一次；循环依赖不在此处检测，由随后的拓扑排序统一处理。
 
-        # 递归处理依赖
-        for dep in dependencies:
-            if dep not in available_modules:
-                raise DependencyError(module_name=module_name, missing_deps=[dep])
+        Args:
+            module_name: 要解析的模块名称
+            available_modules: 所有可用的模块类
 
-            # 递归构建
-            self._build_graph(dep, available_modules, visiting)
+        Returns:
+            (模块名称, 模块类, 依赖元组) 列表
 
-        # 移除当前节点的访问标记（回溯）
-        visiting.discard(module_name)
+        Raises:
+            DependencyError: 目标模块或其依赖缺失
+        """
+        if module_name not in available_modules:
+            raise DependencyError(module_name=module_name)
+
+        nodes: list[_Node] = []
+        seen = {module_name}
+        queue = deque([module_name])
+        while queue:
+            current = queue.popleft()
+            module_class = available_modules[current]
+            dependencies = tuple(getattr(module_class, "dependencies", ()))
+            nodes.append((current, module_class, dependencies))
+
+            for dep in dependencies:
+                if dep not in available_modules:
+                    raise DependencyError(module_name=current, missing_deps=[dep])
+                if dep not in seen:
+                    seen.add(dep)
+                    queue.append(dep)
+
+        return nodes
 
     def get_graph(self) -> DependencyGraph:
         """获取依赖图对象.
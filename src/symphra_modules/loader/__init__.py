@@ -5,8 +5,10 @@
 
 from .base import ModuleLoader
 from .filesystem import FileSystemLoader
+from .memory import MemoryLoader
 
 __all__ = [
     "ModuleLoader",
     "FileSystemLoader",
+    "MemoryLoader",
 ]
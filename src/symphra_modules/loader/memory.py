@@ -0,0 +1,61 @@
+"""内存模块加载器.
+
+这个模块实现了直接使用已定义模块类的加载器。
+职责：提供不访问文件系统的模块发现和加载，适用于测试或模块类已在代码中定义的场景。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..core.exceptions import LoaderError
+from .base import ModuleLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ..core.module import Module
+
+
+class MemoryLoader(ModuleLoader):
+    """内存模块加载器.
+
+    职责：
+    - 直接使用构造时给定的模块类
+    - 不扫描目录、不导入文件
+
+    模块表在构造后只读，因此无需加锁。
+    """
+
+    def __init__(self, modules: Iterable[type[Module]] = ()) -> None:
+        """初始化内存加载器.
+
+        Args:
+            modules: 模块类（以各自的 ``name`` 属性作为模块名）
+        """
+        self._modules: dict[str, type[Module]] = {cls.name: cls for cls in modules}
+
+    def discover(self) -> dict[str, type[Module]]:
+        """发现所有可用模块.
+
+        Returns:
+            模块名到模块类的映射（副本）
+        """
+        return self._modules.copy()
+
+    def load_class(self, name: str) -> type[Module]:
+        """加载指定模块的类.
+
+        Args:
+            name: 模块名称
+
+        Returns:
+            模块类
+
+        Raises:
+            LoaderError: 模块不存在
+        """
+        try:
+            return self._modules[name]
+        except KeyError:
+            raise LoaderError(f"模块 '{name}' 未找到") from None
@@ -8,18 +8,25 @@
 from __future__ import annotations
 
 import logging
+import re
 import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .core import Module, ModuleState, StateStore
 from .core.exceptions import CircularDependencyError, ModuleNotFoundError, ModuleStateError
 from .dependency import DependencyResolver
 from .lifecycle import LifecycleManager
-from .loader import FileSystemLoader, ModuleLoader
+from .loader import FileSystemLoader, MemoryLoader, ModuleLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 logger = logging.getLogger(__name__)
 
+# 合法模块名称：字母（含 Unicode）、数字、下划线、连字符
+_VALID_NAME_RE = re.compile(r"[\w-]+")
+
 
 class ModuleManager:
     """模块管理器 - 优雅的API设计.
@@ -88,6 +95,9 @@ class ModuleManager:
         else:
             self._ignored_modules = ignored_modules or set()
 
+        # list_modules() 的排序结果缓存，_available_modules 变化时置为 None
+        self._sorted_names: tuple[str, ...] | None = None
+
         # 发现模块并过滤掉被忽略的
         all_modules = self._loader.discover()
         self._available_modules = {
@@ -103,6 +113,30 @@ class ModuleManager:
         else:
             logger.info(f"模块管理器已初始化: 发现 {len(self._available_modules)} 个可用模块")
 
+    @classmethod
+    def from_modules(
+        cls,
+        modules: Iterable[type[Module]] = (),
+        *,
+        ignored_modules: set[str] | None = None,
+        state_store: StateStore | None = None,
+    ) -> ModuleManager:
+        """使用已定义的模块类创建管理器（不访问文件系统）.
+
+        Args:
+            modules: 模块类（以各自的 ``name`` 属性作为模块名）
+            ignored_modules: 忽略的模块名称集合（黑名单）
+            state_store: 状态持久化存储（可选）
+
+        Returns:
+            模块管理器
+        """
+        return cls(
+            loader=MemoryLoader(modules),
+            ignored_modules=ignored_modules,
+            state_store=state_store,
+        )
+
     def __enter__(self) -> ModuleManager:
         """上下文管理器入口."""
         return self
@@ -134,7 +168,7 @@ class ModuleManager:
         if not name.strip():
             raise ValueError("模块名称不能为空白字符")
         # 检查是否包含非法字符（仅允许字母、数字、下划线、连字符）
-        if not all(c.isalnum() or c in ("_", "-") for c in name):
+        if not _VALID_NAME_RE.fullmatch(name):
             raise ValueError(f"模块名称 '{name}' 包含非法字符，仅允许字母、数字、下划线和连字符")
 
     def load(self, name: str, force: bool = False) -> Module:
@@ -155,9 +189,22 @@ class ModuleManager:
         """
         # 输入验证
         self._validate_module_name(name)
+        return self._load(name, force)
+
+    def _load(self, name: str, force: bool, reloaded: set[str] | None = None) -> Module:
+        """加载模块及其依赖（不做名称校验）.
+
+        Args:
+            name: 模块名称
+            force: 是否强制重新加载
+            reloaded: 本批次中已强制重新创建过的模块；提供时每个模块在批次内
+                只重新创建一次，避免共享依赖被重复实例化
 
+        Returns:
+            模块实例
+        """
         # 如果不是强制重新加载且已加载，则直接返回（优化：只调用一次 get_instance）
-        if not force:
+        if not force or (reloaded is not None and name in reloaded):
             instance = self._lifecycle.get_instance(name)
             if instance:
                 return instance
@@ -170,9 +217,13 @@ class ModuleManager:
 
         # 按顺序加载模块
         for module_name in load_order:
+            if reloaded is not None and module_name in reloaded:
+                continue
             if not self._lifecycle.has_instance(module_name) or force:
                 module_class = self._available_modules[module_name]
                 self._lifecycle.create_instance(module_class)
+                if reloaded is not None:
+                    reloaded.add(module_name)
 
         instance = self._lifecycle.get_instance(name)
         if not instance:
@@ -338,10 +389,13 @@ class ModuleManager:
         modules = {}
         success_count = 0
         error_count = 0
+        # 强制重新加载时，每个模块在本批次中只重新创建一次
+        reloaded: set[str] = set()
 
         for name in self._available_modules:
             try:
-                modules[name] = self.load(name, force)
+                self._validate_module_name(name)
+                modules[name] = self._load(name, force, reloaded)
                 success_count += 1
             except Exception as e:
                 error_count += 1
@@ -487,7 +541,9 @@ class ModuleManager:
             模块名称列表（已排序）
         """
         with self._lock:
-            return sorted(self._available_modules.keys())
+            if self._sorted_names is None:
+                self._sorted_names = tuple(sorted(self._available_modules))
+            return list(self._sorted_names)
 
     def list_loaded_modules(self) -> list[str]:
         """列出所有已加载的模块.
@@ -568,6 +624,8 @@ class ModuleManager:
             self._available_modules = {
                 name: cls for name, cls in all_modules.items() if name not in self._ignored_modules
             }
+            self._sorted_names = None
+            self._resolver.invalidate()
             new_count = len(self._available_modules)
             logger.info(f"重新发现模块: {old_count} -> {new_count}")
 
@@ -610,6 +668,8 @@ class ModuleManager:
             # 如果模块已经在可用列表中，移除它
             if name in self._available_modules:
                 del self._available_modules[name]
+                self._sorted_names = None
+                self._resolver.invalidate()
                 logger.info(f"模块 '{name}' 已加入黑名单")
 
             # 持久化黑名单
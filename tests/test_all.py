@@ -1,6 +1,7 @@
 """测试套件 - Symphra Modules."""
 
 import asyncio
+import re
 import tempfile
 from pathlib import Path
 
@@ -1284,10 +1285,8 @@ class TestModuleHelpers:
             name = "test"
 
         mod = TestModule()
-        repr_str = repr(mod)
-        assert "TestModule" in repr_str
-        assert "test" in repr_str
-        assert "loaded" in repr_str.lower()
+        tokens = set(re.findall(r"\w+", repr(mod).lower()))
+        assert {"testmodule", "test", "loaded"} <= tokens
 
     def test_module_loaded_at(self) -> None:
         """测试模块加载时间."""
@@ -1300,6 +1299,7 @@ class TestModuleHelpers:
         mod = TestModule()
         after = datetime.now()
 
+        assert isinstance(mod.loaded_at, datetime)
         assert before <= mod.loaded_at <= after
 
 
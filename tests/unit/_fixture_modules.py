@@ -0,0 +1,171 @@
+"""单元测试用的模块源码模板与写入工具.
+
+同一份源码只编译一次，之后写入的模块文件直接附带缓存的字节码，导入时跳过编译。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import py_compile
+import string
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# 标准测试模块模板：$name 为模块名，$version 为版本，$dependencies 为依赖列表，
+# $body 为附加的类体（方法定义等）
+_TEST_MODULE_TEMPLATE = string.Template(
+    """
+from symphra_modules import Module
+
+class TestModule(Module):
+    name = "$name"
+    version = "$version"
+    dependencies = $dependencies
+$body"""
+)
+
+# 源码摘要 -> 基于哈希校验的 .pyc 字节（整个测试会话共享）
+_BYTECODE_CACHE: dict[bytes, bytes] = {}
+
+
+@cache
+def build_module_source(
+    name: str = "test",
+    body: str = "",
+    *,
+    version: str = "1.0.0",
+    dependencies: tuple[str, ...] = (),
+) -> str:
+    """根据标准模板生成测试模块源码（相同参数只生成一次）.
+
+    Args:
+        name: 模块名称
+        body: 追加到 TestModule 类体中的代码（需自带 4 空格缩进），可由 ``BODY_*`` 拼接
+        version: 模块版本
+        dependencies: 依赖的模块名称
+
+    Returns:
+        模块源码
+    """
+    return _TEST_MODULE_TEMPLATE.substitute(
+        name=name, version=version, dependencies=list(dependencies), body=body
+    )
+
+
+# 常用的类体片段（空操作的生命周期方法）
+BODY_START = "\n    def start(self):\n        pass\n"
+BODY_STOP = "\n    def stop(self):\n        pass\n"
+BODY_BOOTSTRAP = "\n    def bootstrap(self):\n        pass\n"
+BODY_ASYNC_START = "\n    async def start_async(self):\n        pass\n"
+BODY_ASYNC_STOP = "\n    async def stop_async(self):\n        pass\n"
+
+# 常用的 TestModule 源码（name = "test"）
+TEMPLATE_BARE = build_module_source()
+TEMPLATE_WITH_START = build_module_source(body=BODY_START)
+TEMPLATE_WITH_BOOTSTRAP = build_module_source(body=BODY_BOOTSTRAP)
+TEMPLATE_WITH_ASYNC_START = build_module_source(body=BODY_ASYNC_START)
+
+# 会话开始时统一预编译的源码
+COMMON_TEMPLATES: tuple[str, ...] = (
+    TEMPLATE_BARE,
+    TEMPLATE_WITH_START,
+    TEMPLATE_WITH_BOOTSTRAP,
+    TEMPLATE_WITH_ASYNC_START,
+)
+
+
+@cache
+def encoded(source: str) -> bytes:
+    """返回源码的 UTF-8 编码（每份源码只编码一次）."""
+    return source.encode("utf-8")
+
+
+def source_key(source: str) -> bytes:
+    """计算源码在字节码缓存中的键."""
+    return hashlib.blake2b(encoded(source), digest_size=8).digest()
+
+
+def prime_bytecode(source: str, bytecode: bytes) -> None:
+    """预先放入一份源码对应的 CHECKED_HASH 字节码（已存在时保留原值）."""
+    _BYTECODE_CACHE.setdefault(source_key(source), bytecode)
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """用 open/write/close 三次系统调用写入文件，绕过 io 缓冲层.
+
+    测试文件都很小，一次 ``os.write`` 即可写完（仍循环以防短写）。
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+class ModuleWriter(Protocol):
+    """写入单个测试模块文件的函数."""
+
+    def __call__(self, directory: Path, stem: str, source: str) -> Path: ...
+
+
+def write_fixture(directory: Path, stem: str, source: str) -> Path:
+    """写入模块源码，并在 __pycache__ 中放置缓存的字节码.
+
+    字节码使用 CHECKED_HASH 失效模式：导入时只校验源码哈希，
+    与文件修改时间无关，因此同一份字节码可以复用到任意路径。
+    """
+    module_file = directory / f"{stem}.py"
+    write_file(module_file, encoded(source))
+
+    cache_file = Path(importlib.util.cache_from_source(str(module_file)))
+    key = source_key(source)
+    bytecode = _BYTECODE_CACHE.get(key)
+    if bytecode is None:
+        # 首次遇到这份源码：真正编译一次并缓存结果
+        py_compile.compile(
+            str(module_file),
+            cfile=str(cache_file),
+            doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+        )
+        _BYTECODE_CACHE[key] = cache_file.read_bytes()
+    else:
+        cache_file.parent.mkdir(exist_ok=True)
+        write_file(cache_file, bytecode)
+
+    return module_file
+
+
+class ModulesWriter(Protocol):
+    """批量写入测试模块文件的函数."""
+
+    def __call__(self, root: Path, files: Mapping[str, str]) -> list[Path]: ...
+
+
+def write_many(root: Path, files: Mapping[str, str]) -> list[Path]:
+    """一次写入一批模块文件.
+
+    Args:
+        root: 根目录
+        files: {相对路径（不含 .py，可带子目录，如 "dir1/module1"）: 源码}
+
+    Returns:
+        写入的模块文件路径列表
+    """
+    paths: list[Path] = []
+    for relative, source in files.items():
+        target = root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        paths.append(write_fixture(target.parent, target.name, source))
+    return paths
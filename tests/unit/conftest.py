@@ -0,0 +1,164 @@
+"""单元测试共享 fixtures.
+
+模块源码模板与写入工具见 ``_fixture_modules``。
+"""
+
+from __future__ import annotations
+
+import compileall
+import hashlib
+import importlib.util
+import os
+import py_compile
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+import pytest
+
+from symphra_modules.loader.filesystem import FileSystemLoader
+
+from ._fixture_modules import (
+    COMMON_TEMPLATES,
+    encoded,
+    prime_bytecode,
+    source_key,
+    write_fixture,
+    write_many,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from ._fixture_modules import ModulesWriter, ModuleWriter
+
+
+@pytest.fixture(scope="session")
+def precompiled_fixtures(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """会话开始时一次性预编译常用测试模块源码，并填充字节码缓存.
+
+    所有常用源码写入同一目录后由 ``compileall.compile_dir`` 统一编译，
+    之后 ``write_module`` 写入这些源码时直接复用缓存的字节码。
+
+    Returns:
+        预编译目录
+    """
+    base = tmp_path_factory.mktemp("precompiled")
+    sources: dict[Path, str] = {}
+    for source in COMMON_TEMPLATES:
+        module_file = base / f"m_{source_key(source).hex()}.py"
+        module_file.write_bytes(encoded(source))
+        sources[module_file] = source
+
+    # 源码只有几个且都很小，进程池的启动开销远大于编译本身，因此串行编译
+    compileall.compile_dir(
+        str(base),
+        quiet=1,
+        workers=1,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+    for module_file, source in sources.items():
+        cache_file = Path(importlib.util.cache_from_source(str(module_file)))
+        prime_bytecode(source, cache_file.read_bytes())
+    return base
+
+
+@pytest.fixture(scope="session")
+def write_module(precompiled_fixtures: Path) -> ModuleWriter:
+    """返回写入测试模块文件（附带预编译字节码）的函数."""
+    return write_fixture
+
+
+@pytest.fixture(scope="session")
+def write_modules(precompiled_fixtures: Path) -> ModulesWriter:
+    """返回批量写入测试模块文件的函数."""
+    return write_many
+
+
+class ScratchFactory(Protocol):
+    """``loader_scratch`` fixture 返回的函数."""
+
+    def __call__(self, source: str, stem: str = "test") -> Path: ...
+
+
+@pytest.fixture(scope="session")
+def loader_scratch(
+    tmp_path_factory: pytest.TempPathFactory, precompiled_fixtures: Path
+) -> ScratchFactory:
+    """整个测试会话共享的只读模块目录.
+
+    返回的函数按源码内容定位子目录：首次调用时写入模块源码（附带预编译字节码），
+    之后相同源码直接复用同一目录。调用方不得修改目录内容。
+    """
+    root = tmp_path_factory.mktemp("loader_fixtures", numbered=False)
+
+    def _scratch(source: str, stem: str = "test") -> Path:
+        directory = root / f"{stem}-{source_key(source).hex()}"
+        if not directory.exists():
+            directory.mkdir()
+            write_fixture(directory, stem, source)
+        return directory
+
+    return _scratch
+
+
+class ModuleDirFactory(Protocol):
+    """``module_dir`` fixture 返回的函数."""
+
+    def __call__(self, files: Mapping[str, str]) -> Path: ...
+
+
+@pytest.fixture(scope="session")
+def module_dir(
+    tmp_path_factory: pytest.TempPathFactory, precompiled_fixtures: Path
+) -> ModuleDirFactory:
+    """整个测试会话共享的只读模块目录.
+
+    返回的函数按 ``{文件名（不含 .py）: 源码}`` 的内容定位目录：首次调用时一次性
+    写入全部模块文件（附带字节码），之后相同的文件集合直接复用同一目录。
+    调用方不得修改目录内容；需要增删文件的测试应使用 ``tmp_path``。
+    """
+    root = tmp_path_factory.mktemp("module_dirs", numbered=False)
+
+    def _module_dir(files: Mapping[str, str]) -> Path:
+        digest = hashlib.blake2b(digest_size=8)
+        for stem, source in sorted(files.items()):
+            digest.update(encoded(stem))
+            digest.update(b"\0")
+            digest.update(encoded(source))
+            digest.update(b"\0")
+        directory = root / digest.hexdigest()
+        if not directory.exists():
+            directory.mkdir()
+            write_many(directory, files)
+        return directory
+
+    return _module_dir
+
+
+@pytest.fixture
+def fast_tmp_path(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """临时目录，Linux 下优先放在内存文件系统 /dev/shm 中.
+
+    在其它平台或 /dev/shm 不可写时退回到 pytest 的临时目录。
+    """
+    if sys.platform == "linux" and os.access("/dev/shm", os.W_OK):
+        base = Path(tempfile.mkdtemp(dir="/dev/shm"))
+        yield base
+        shutil.rmtree(base, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("t")
+
+
+@pytest.fixture(scope="module")
+def empty_fs_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """空的模块目录（同一测试模块内共享，只读）."""
+    return tmp_path_factory.mktemp("empty")
+
+
+@pytest.fixture(scope="module")
+def empty_fs_loader(empty_fs_dir: Path) -> FileSystemLoader:
+    """绑定到空目录的文件系统加载器（同一测试模块内共享）."""
+    return FileSystemLoader([empty_fs_dir])
@@ -3,56 +3,111 @@
 测试Module类的基本功能、属性、生命周期方法等。
 """
 
-import asyncio
+import re
 from datetime import datetime
+from typing import Any
 
 import pytest
 
 from symphra_modules import Module, ModuleState, call_module_method, is_async_module
 
+# 将 repr 拆成单词 token，便于一次性做子集判断
+_REPR_TOKEN_RE = re.compile(r"\w+")
+
+
+class _MinimalModule(Module):
+    name = "minimal"
+
+
+class _FullMetadataModule(Module):
+    name = "test"
+    version = "2.0.0"
+    dependencies = ["config"]
+
+
+class _SimpleModule(Module):
+    name = "simple"
+
+
+class _DBModule(Module):
+    name = "database"
+    dependencies = ["config"]
+
+
+class _LifecycleModule(Module):
+    """记录 bootstrap/start/stop 调用的模块."""
+
+    name = "lifecycle"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bootstrapped = False
+        self.started = False
+        self.stopped = False
+
+    def bootstrap(self) -> None:
+        self.bootstrapped = True
+
+    def start(self) -> None:
+        self.started = True
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+class _SyncModule(Module):
+    name = "sync"
+
+    def start(self) -> None:
+        pass
+
+
+class _AsyncModule(Module):
+    name = "async"
+
+    async def start_async(self) -> None:
+        pass
+
+    async def stop_async(self) -> None:
+        pass
+
+
+class _MethodCallModule(Module):
+    """提供同步/异步方法供 call_module_method 调用的模块."""
+
+    name = "test"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.called = False
+
+    def my_method(self) -> str:
+        self.called = True
+        return "result"
+
+    async def my_async_method(self) -> str:
+        self.called = True
+        return "async_result"
+
 
 class TestModule:
     """测试模块基类."""
 
     def test_module_basic(self) -> None:
         """测试基本模块定义."""
-
-        class SimpleModule(Module):
-            name = "simple"
-
-        mod = SimpleModule()
+        mod = _SimpleModule()
         assert mod.name == "simple"
         assert mod.state == ModuleState.LOADED
         assert mod.version == "0.1.0"
 
     def test_module_with_dependencies(self) -> None:
         """测试带依赖的模块."""
-
-        class DBModule(Module):
-            name = "database"
-            dependencies = ["config"]
-
-        assert DBModule.dependencies == ["config"]
-        assert DBModule.name == "database"
+        assert _DBModule.dependencies == ["config"]
+        assert _DBModule.name == "database"
 
     def test_module_lifecycle(self) -> None:
         """测试模块生命周期."""
-
-        class LifecycleModule(Module):
-            name = "lifecycle"
-
-            def __init__(self) -> None:
-                super().__init__()
-                self.started = False
-                self.stopped = False
-
-            def start(self) -> None:
-                self.started = True
-
-            def stop(self) -> None:
-                self.stopped = True
-
-        mod = LifecycleModule()
+        mod = _LifecycleModule()
         assert not mod.started
         assert not mod.stopped
 
@@ -66,51 +121,58 @@ class TestModule:
 class TestModuleProperties:
     """测试模块属性."""
 
-    def test_module_metadata(self) -> None:
-        """测试模块元数据."""
-
-        class TestModule(Module):
-            name = "test"
-            version = "2.0.0"
-
-        mod = TestModule()
-        assert mod.name == "test"
-        assert mod.version == "2.0.0"
-
-    def test_module_default_values(self) -> None:
-        """测试模块默认值."""
-
-        class MinimalModule(Module):
-            name = "minimal"
-
-        mod = MinimalModule()
-        assert mod.version == "0.1.0"
-        assert mod.dependencies == []
-        assert mod.state == ModuleState.LOADED
+    @pytest.mark.parametrize(
+        ("module_class", "expected"),
+        [
+            pytest.param(
+                _MinimalModule,
+                {
+                    "name": "minimal",
+                    "version": "0.1.0",
+                    "dependencies": [],
+                    "state": ModuleState.LOADED,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                _FullMetadataModule,
+                {
+                    "name": "test",
+                    "version": "2.0.0",
+                    "dependencies": ["config"],
+                    "state": ModuleState.LOADED,
+                },
+                id="full",
+            ),
+        ],
+    )
+    def test_module_metadata(self, module_class: type[Module], expected: dict[str, Any]) -> None:
+        """测试模块元数据（默认值与完整定义）."""
+        mod = module_class()
+        actual = {
+            "name": mod.name,
+            "version": mod.version,
+            "dependencies": mod.dependencies,
+            "state": mod.state,
+        }
+        assert actual == expected
 
     def test_module_loaded_at(self) -> None:
         """测试模块加载时间."""
-
-        class TestModule(Module):
-            name = "test"
-
         before = datetime.now()
-        mod = TestModule()
+        mod = _MinimalModule()
         after = datetime.now()
 
+        assert isinstance(mod.loaded_at, datetime)
         assert before <= mod.loaded_at <= after
+        # 首次访问后缓存 datetime 对象
+        assert mod.loaded_at is mod.loaded_at
 
     def test_module_repr(self) -> None:
         """测试模块字符串表示."""
-
-        class TestModule(Module):
-            name = "test"
-
-        mod = TestModule()
-        repr_str = repr(mod)
-        assert "TestModule" in repr_str
-        assert "test" in repr_str
-        assert "loaded" in repr_str.lower()
+        mod = _MinimalModule()
+        tokens = set(_REPR_TOKEN_RE.findall(repr(mod).lower()))
+        assert {"_minimalmodule", "minimal", "loaded"} <= tokens
 
 
 class TestModuleHelpers:
@@ -118,68 +180,29 @@ class TestModuleHelpers:
 
     def test_is_async_module(self) -> None:
         """测试异步模块检测."""
-
         # 同步模块
-        class SyncModule(Module):
-            name = "sync"
-
-            def start(self):
-                pass
-
-        sync_mod = SyncModule()
-        assert not is_async_module(sync_mod)
+        assert not is_async_module(_SyncModule())
 
         # 真正的异步模块
-        class AsyncModule(Module):
-            name = "async"
+        assert is_async_module(_AsyncModule())
 
-            async def start_async(self):
-                pass
-
-            async def stop_async(self):
-                pass
-
-        async_mod = AsyncModule()
-        assert is_async_module(async_mod)
-
-    def test_call_module_method(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_call_module_method(self) -> None:
         """测试调用模块方法."""
-
-        class TestModule(Module):
-            name = "test"
-
-            def __init__(self):
-                super().__init__()
-                self.called = False
-
-            def my_method(self):
-                self.called = True
-                return "result"
-
-            async def my_async_method(self):
-                self.called = True
-                return "async_result"
-
-        mod = TestModule()
+        mod = _MethodCallModule()
 
         # 测试同步方法
-        async def test_sync():
-            result = await call_module_method(mod, "my_method")
-            assert result == "result"
-            assert mod.called
-
-        asyncio.run(test_sync())
+        result = await call_module_method(mod, "my_method")
+        assert result == "result"
+        assert mod.called
 
         # 重置
         mod.called = False
 
         # 测试异步方法
-        async def test_async():
-            result = await call_module_method(mod, "my_async_method")
-            assert result == "async_result"
-            assert mod.called
-
-        asyncio.run(test_async())
+        result = await call_module_method(mod, "my_async_method")
+        assert result == "async_result"
+        assert mod.called
 
 
 class TestLifecycleEdgeCases:
@@ -187,18 +210,7 @@ class TestLifecycleEdgeCases:
 
     def test_module_bootstrap_method(self) -> None:
         """测试模块的 bootstrap 方法."""
-
-        class TestModule(Module):
-            name = "test"
-
-            def __init__(self):
-                super().__init__()
-                self.bootstrapped = False
-
-            def bootstrap(self):
-                self.bootstrapped = True
-
-        mod = TestModule()
+        mod = _LifecycleModule()
         assert not mod.bootstrapped
 
         mod.bootstrap()
@@ -206,18 +218,7 @@ class TestLifecycleEdgeCases:
 
     def test_module_start_method(self) -> None:
         """测试模块的 start 方法."""
-
-        class TestModule(Module):
-            name = "test"
-
-            def __init__(self):
-                super().__init__()
-                self.started = False
-
-            def start(self):
-                self.started = True
-
-        mod = TestModule()
+        mod = _LifecycleModule()
         assert not mod.started
 
         mod.start()
@@ -225,48 +226,20 @@ class TestLifecycleEdgeCases:
 
     def test_module_stop_method(self) -> None:
         """测试模块的 stop 方法."""
-
-        class TestModule(Module):
-            name = "test"
-
-            def __init__(self):
-                super().__init__()
-                self.stopped = False
-
-            def stop(self):
-                self.stopped = True
-
-        mod = TestModule()
+        mod = _LifecycleModule()
         assert not mod.stopped
 
         mod.stop()
         assert mod.stopped
 
-    def test_async_default_implementation(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_async_default_implementation(self) -> None:
         """测试异步方法的默认实现."""
-
-        class TestModule(Module):
-            name = "test"
-
-            def __init__(self):
-                super().__init__()
-                self.started = False
-                self.stopped = False
-
-            def start(self):
-                self.started = True
-
-            def stop(self):
-                self.stopped = True
-
-        mod = TestModule()
+        mod = _LifecycleModule()
 
         # 异步方法应该调用同步方法
-        async def test():
-            await mod.start_async()
-            assert mod.started
-
-            await mod.stop_async()
-            assert mod.stopped
+        await mod.start_async()
+        assert mod.started
 
-        asyncio.run(test())
+        await mod.stop_async()
+        assert mod.stopped
@@ -6,61 +6,83 @@
 - manager.py 的列表路径、异常处理等
 """
 
+import sys
+from collections.abc import Iterator
 from pathlib import Path
-from unittest.mock import patch
+from typing import TYPE_CHECKING
 
 import pytest
 
 from symphra_modules import Module, ModuleManager
 from symphra_modules.core import FileStateStore, ModuleState
+from symphra_modules.core.exceptions import CircularDependencyError
 from symphra_modules.core.module import is_async_module
 from symphra_modules.dependency.graph import DependencyGraph
 
+if TYPE_CHECKING:
+    from ._fixture_modules import ModulesWriter
+
 # ============================================================================
 # core/module.py 测试
 # ============================================================================
 
 
-def test_module_default_bootstrap() -> None:
-    """测试模块默认的 bootstrap 实现（空操作）."""
+class _MinimalModule(Module):
+    name = "minimal"
+    version = "1.0.0"
+
+
+class _StopRecorderModule(Module):
+    name = "minimal"
+    version = "1.0.0"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.stop_called = False
+
+    def stop(self) -> None:
+        self.stop_called = True
 
-    class MinimalModule(Module):
-        name = "minimal"
-        version = "1.0.0"
 
-    module = MinimalModule()
+class _NoAsyncModule(Module):
+    name = "no_async"
+    version = "1.0.0"
+
+    # 删除继承的异步方法
+    def __delattr__(self, name: str) -> None:
+        pass
+
+
+class _SyncMethodModule(Module):
+    name = "sync_method"
+    version = "1.0.0"
+
+    # 覆盖为非协程方法
+    def start_async(self) -> None:  # type: ignore
+        pass
+
+    def stop_async(self) -> None:  # type: ignore
+        pass
+
+
+def test_module_default_bootstrap() -> None:
+    """测试模块默认的 bootstrap 实现（空操作）."""
+    module = _MinimalModule()
     # 调用默认的 bootstrap，应该不抛异常
     module.bootstrap()  # 覆盖 line 52
 
 
 def test_module_default_start() -> None:
     """测试模块默认的 start 实现（空操作）."""
-
-    class MinimalModule(Module):
-        name = "minimal"
-        version = "1.0.0"
-
-    module = MinimalModule()
+    module = _MinimalModule()
     # 调用默认的 start，应该不抛异常
     module.start()  # 覆盖 line 59
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_module_default_stop_async() -> None:
     """测试模块默认的 stop_async 实现（调用同步方法）."""
-
-    class MinimalModule(Module):
-        name = "minimal"
-        version = "1.0.0"
-
-        def __init__(self) -> None:
-            super().__init__()
-            self.stop_called = False
-
-        def stop(self) -> None:
-            self.stop_called = True
-
-    module = MinimalModule()
+    module = _StopRecorderModule()
     # 调用默认的 stop_async，应该调用同步的 stop
     await module.stop_async()  # 覆盖 line 82
     assert module.stop_called
@@ -68,16 +90,7 @@ async def test_module_default_stop_async() -> None:
 
 def test_is_async_module_missing_method() -> None:
     """测试 is_async_module 当模块缺少异步方法时返回 False."""
-
-    class NoAsyncModule(Module):
-        name = "no_async"
-        version = "1.0.0"
-
-        # 删除继承的异步方法
-        def __delattr__(self, name: str) -> None:
-            pass
-
-    module = NoAsyncModule()
+    module = _NoAsyncModule()
     # 手动删除异步方法属性
     if hasattr(module, "start_async"):
         delattr(module, "start_async")
@@ -89,37 +102,22 @@ def test_is_async_module_missing_method() -> None:
 
 def test_is_async_module_non_coroutine_method() -> None:
     """测试 is_async_module 当方法不是协程时返回 False."""
-
-    class SyncMethodModule(Module):
-        name = "sync_method"
-        version = "1.0.0"
-
-        # 覆盖为非协程方法
-        def start_async(self) -> None:  # type: ignore
-            pass
-
-        def stop_async(self) -> None:  # type: ignore
-            pass
-
-    module = SyncMethodModule()
+    module = _SyncMethodModule()
     result = is_async_module(module)  # 覆盖 line 125
     assert result is False
 
 
 def test_is_async_module_cannot_get_source() -> None:
     """测试 is_async_module 当无法获取源码时返回 True."""
+    module = _MinimalModule()
 
-    class BuiltinLikeModule(Module):
-        name = "builtin_like"
-        version = "1.0.0"
-
-    module = BuiltinLikeModule()
+    def _unreadable_source(obj: object) -> str:
+        raise OSError("source not available")
 
-    # Mock inspect.getsource 使其抛出异常
-    with patch("symphra_modules.core.module.inspect.getsource", side_effect=OSError):
-        result = is_async_module(module)  # 覆盖 lines 138-140
-        # 无法获取源码时，假设是真正的异步实现
-        assert result is True
+    # 注入一个总是失败的源码读取函数
+    result = is_async_module(module, _source_reader=_unreadable_source)  # 覆盖 lines 138-140
+    # 无法获取源码时，假设是真正的异步实现
+    assert result is True
 
 
 # ============================================================================
@@ -190,96 +188,46 @@ def test_dependency_graph_get_all_nodes() -> None:
 # ============================================================================
 
 
-def test_manager_with_multiple_module_directories(tmp_path: Path) -> None:
-    """测试 ModuleManager 使用多个模块目录."""
-    # 创建两个目录
-    dir1 = tmp_path / "modules1"
-    dir2 = tmp_path / "modules2"
-    dir1.mkdir()
-    dir2.mkdir()
-
-    # 在第一个目录创建模块
-    (dir1 / "module1.py").write_text(
-        """
+# 各测试用到的模块文件: {子目录: {文件名: 源码}}
+_MANAGER_MODULE_SOURCES: dict[str, dict[str, str]] = {
+    "modules1": {
+        "module1.py": """
 from symphra_modules import Module
 
 class Module1(Module):
     name = "module1"
     version = "1.0.0"
     dependencies = []
-"""
-    )
-
-    # 在第二个目录创建模块
-    (dir2 / "module2.py").write_text(
-        """
+""",
+    },
+    "modules2": {
+        "module2.py": """
 from symphra_modules import Module
 
 class Module2(Module):
     name = "module2"
     version = "1.0.0"
     dependencies = []
-"""
-    )
-
-    # 使用列表路径创建管理器
-    manager = ModuleManager([dir1, dir2])  # 覆盖 line 67
-
-    # 验证两个模块都被发现
-    modules = manager.list_modules()
-    assert "module1" in modules
-    assert "module2" in modules
-
-
-def test_manager_with_state_store_and_ignored_modules(tmp_path: Path) -> None:
-    """测试 ModuleManager 同时使用 state_store 和 ignored_modules 参数."""
-    state_file = tmp_path / "states.json"
-    module_dir = tmp_path / "modules"
-    module_dir.mkdir()
-
-    # 创建测试模块
-    (module_dir / "test1.py").write_text(
-        """
+""",
+    },
+    "modules": {
+        "test1.py": """
 from symphra_modules import Module
 
 class Test1(Module):
     name = "test1"
     version = "1.0.0"
     dependencies = []
-"""
-    )
-
-    (module_dir / "test2.py").write_text(
-        """
+""",
+        "test2.py": """
 from symphra_modules import Module
 
 class Test2(Module):
     name = "test2"
     version = "1.0.0"
     dependencies = []
-"""
-    )
-
-    # 创建 state_store，先保存一个忽略的模块
-    store = FileStateStore(state_file)
-    store.save_ignored_modules({"test1"})
-
-    # 创建管理器时，同时提供 state_store 和额外的 ignored_modules
-    manager = ModuleManager(
-        module_dir, state_store=store, ignored_modules={"test2"}
-    )  # 覆盖 lines 86-87
-
-    # 验证两个模块都被忽略
-    modules = manager.list_modules()
-    assert "test1" not in modules
-    assert "test2" not in modules
-
-
-def test_manager_context_exit_with_exception(tmp_path: Path) -> None:
-    """测试 ModuleManager 上下文管理器退出时的异常处理."""
-    module_file = tmp_path / "bad_module.py"
-    module_file.write_text(
-        """
+""",
+        "bad_module.py": """
 from symphra_modules import Module
 
 class BadModule(Module):
@@ -289,27 +237,8 @@ class BadModule(Module):
 
     def stop(self):
         raise RuntimeError("Stop failed")
-"""
-    )
-
-    # 使用上下文管理器
-    try:
-        with ModuleManager(tmp_path) as manager:
-            manager.load("bad")
-            manager.start("bad")
-            # 在退出时会调用 stop_all，bad 模块的 stop 会失败
-            # 但不应该抛出异常，只是记录日志
-    except Exception:
-        # 不应该到这里
-        pytest.fail("Context manager should not raise exception on exit")
-    # 覆盖 lines 111-112
-
-
-def test_manager_unload_with_stop_exception(tmp_path: Path) -> None:
-    """测试 unload 时停止模块失败的异常处理."""
-    module_file = tmp_path / "bad_stop.py"
-    module_file.write_text(
-        """
+""",
+        "bad_stop.py": """
 from symphra_modules import Module
 
 class BadStopModule(Module):
@@ -322,25 +251,8 @@ class BadStopModule(Module):
 
     def stop(self):
         raise RuntimeError("Stop failed!")
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
-    manager.load("bad_stop")
-    manager.start("bad_stop")
-
-    # unload 应该尝试停止模块，即使停止失败也应该继续卸载
-    manager.unload("bad_stop")  # 覆盖 lines 311-314
-
-    # 验证模块已被卸载
-    assert manager.get_module("bad_stop") is None
-
-
-def test_manager_start_all_with_topological_sort_failure(tmp_path: Path) -> None:
-    """测试 start_all 时拓扑排序失败的异常处理."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
+""",
+        "test.py": """
 from symphra_modules import Module
 
 class TestModule(Module):
@@ -350,23 +262,115 @@ class TestModule(Module):
 
     def start(self):
         pass
-"""
+""",
+    },
+}
+
+# 加载器以文件名注册到 sys.modules 的模块名
+_GENERATED_MODULE_NAMES = tuple(
+    Path(filename).stem for files in _MANAGER_MODULE_SOURCES.values() for filename in files
+)
+
+
+@pytest.fixture(scope="module")
+def modules_root(tmp_path_factory: pytest.TempPathFactory, write_modules: "ModulesWriter") -> Path:
+    """一次性写入本模块所有管理器测试需要的模块文件（只读共享）."""
+    root = tmp_path_factory.mktemp("manager_coverage")
+    write_modules(
+        root,
+        {
+            f"{subdir}/{Path(filename).stem}": source
+            for subdir, files in _MANAGER_MODULE_SOURCES.items()
+            for filename, source in files.items()
+        },
     )
+    return root
+
+
+class TestManagerCoverage:
+    """ModuleManager 覆盖率补充测试（共享一次性写入的模块目录）."""
+
+    @pytest.fixture(autouse=True)
+    def _cleanup_sys_modules(self) -> Iterator[None]:
+        """每个测试结束后移除动态导入的模块，保持导入隔离."""
+        yield
+        for name in _GENERATED_MODULE_NAMES:
+            sys.modules.pop(name, None)
+
+    def test_manager_with_multiple_module_directories(self, modules_root: Path) -> None:
+        """测试 ModuleManager 使用多个模块目录."""
+        # 使用列表路径创建管理器
+        manager = ModuleManager(
+            [modules_root / "modules1", modules_root / "modules2"]
+        )  # 覆盖 line 67
+
+        # 验证两个模块都被发现
+        modules = manager.list_modules()
+        assert "module1" in modules
+        assert "module2" in modules
+
+    def test_manager_with_state_store_and_ignored_modules(
+        self, modules_root: Path, tmp_path: Path
+    ) -> None:
+        """测试 ModuleManager 同时使用 state_store 和 ignored_modules 参数."""
+        # 创建 state_store，先保存一个忽略的模块
+        store = FileStateStore(tmp_path / "states.json")
+        store.save_ignored_modules({"test1"})
+
+        # 创建管理器时，同时提供 state_store 和额外的 ignored_modules
+        manager = ModuleManager(
+            modules_root / "modules", state_store=store, ignored_modules={"test2"}
+        )  # 覆盖 lines 86-87
+
+        # 验证两个模块都被忽略
+        modules = manager.list_modules()
+        assert "test1" not in modules
+        assert "test2" not in modules
+
+    def test_manager_context_exit_with_exception(self, modules_root: Path) -> None:
+        """测试 ModuleManager 上下文管理器退出时的异常处理."""
+        # 使用上下文管理器
+        try:
+            with ModuleManager(modules_root / "modules") as manager:
+                manager.load("bad")
+                manager.start("bad")
+                # 在退出时会调用 stop_all，bad 模块的 stop 会失败
+                # 但不应该抛出异常，只是记录日志
+        except Exception:
+            # 不应该到这里
+            pytest.fail("Context manager should not raise exception on exit")
+        # 覆盖 lines 111-112
+
+    def test_manager_unload_with_stop_exception(self, modules_root: Path) -> None:
+        """测试 unload 时停止模块失败的异常处理."""
+        manager = ModuleManager(modules_root / "modules")
+        manager.load("bad_stop")
+        manager.start("bad_stop")
+
+        # unload 应该尝试停止模块，即使停止失败也应该继续卸载
+        manager.unload("bad_stop")  # 覆盖 lines 311-314
+
+        # 验证模块已被卸载
+        assert manager.get_module("bad_stop") is None
+
+    def test_manager_start_all_with_topological_sort_failure(self, modules_root: Path) -> None:
+        """测试 start_all 时拓扑排序失败的异常处理."""
+        manager = ModuleManager(modules_root / "modules")
+        manager.load("test")
+
+        # 向依赖图注入自环，使拓扑排序真实地抛出循环依赖错误
+        graph = manager._resolver.get_graph()
+        graph.add_node("test", ["test"])
+        with pytest.raises(CircularDependencyError):
+            graph.topological_sort()
 
-    manager = ModuleManager(tmp_path)
-    manager.load("test")
-
-    # Mock 拓扑排序失败
-    with patch.object(
-        manager._resolver.get_graph(), "topological_sort", side_effect=Exception("Mocked error")
-    ):
         # start_all 应该回退到使用实例顺序
         manager.start_all()  # 覆盖 lines 361-363
 
-    # 验证模块仍然启动成功
-    module = manager.get_module("test")
-    assert module is not None
-    assert module.state == ModuleState.STARTED
+        # 验证模块仍然启动成功
+        module = manager.get_module("test")
+        assert module is not None
+        assert module.state == ModuleState.STARTED
 
 
 # ============================================================================
@@ -6,12 +6,77 @@
 - 错误处理
 """
 
+import sys
+from itertools import pairwise
+
 import pytest
 
 from symphra_modules.core.exceptions import CircularDependencyError
 from symphra_modules.dependency.graph import DependencyGraph
 
 
+def _build_graph(edges: list[tuple[str, list[str]]]) -> DependencyGraph:
+    """按给定的边构建依赖图并预热拓扑排序缓存."""
+    graph = DependencyGraph()
+    graph.add_nodes(edges)
+    graph.topological_sort()
+    return graph
+
+
+def _assert_order(result: list[str], pairs: list[tuple[str, str]]) -> None:
+    """断言排序结果中每对 (前, 后) 的先后顺序（位置表只构建一次）."""
+    pos = {name: i for i, name in enumerate(result)}
+    violated = [(before, after) for before, after in pairs if pos[before] >= pos[after]]
+    assert not violated, f"排序结果 {result} 违反依赖顺序: {violated}"
+
+
+# 只读测试共享的依赖图形状（模块级构建一次）
+LINEAR_EDGES = [("a", []), ("b", ["a"]), ("c", ["b"]), ("d", ["c"])]
+
+#     a
+#    / \
+#   b   c
+#    \ /
+#     d
+DIAMOND_EDGES = [("a", []), ("b", ["a"]), ("c", ["a"]), ("d", ["b", "c"])]
+
+#       a
+#      / \
+#     b   c
+#    / \ / \
+#   d   e   f
+#    \ / \ /
+#     g   h
+COMPLEX_EDGES = [
+    ("a", []),
+    ("b", ["a"]),
+    ("c", ["a"]),
+    ("d", ["b"]),
+    ("e", ["b", "c"]),
+    ("f", ["c"]),
+    ("g", ["d", "e"]),
+    ("h", ["e", "f"]),
+]
+
+
+@pytest.fixture(scope="module")
+def linear_graph() -> DependencyGraph:
+    """线性依赖链 a <- b <- c <- d（只读）."""
+    return _build_graph(LINEAR_EDGES)
+
+
+@pytest.fixture(scope="module")
+def diamond_graph() -> DependencyGraph:
+    """菱形依赖图（只读）."""
+    return _build_graph(DIAMOND_EDGES)
+
+
+@pytest.fixture(scope="module")
+def complex_graph() -> DependencyGraph:
+    """复杂依赖图（只读）."""
+    return _build_graph(COMPLEX_EDGES)
+
+
 def test_add_module_without_dependencies() -> None:
     """测试添加没有依赖的模块."""
     graph = DependencyGraph()
@@ -21,6 +86,35 @@ def test_add_module_without_dependencies() -> None:
     assert graph.get_dependencies("module1") == set()
 
 
+def test_add_nodes_matches_individual_adds() -> None:
+    """测试批量添加与逐个添加得到相同的图，且只递增一次版本号."""
+    individual = DependencyGraph()
+    for name, deps in COMPLEX_EDGES:
+        individual.add_node(name, deps)
+
+    bulk = DependencyGraph()
+    version = bulk.version
+    bulk.add_nodes(COMPLEX_EDGES)
+
+    assert bulk.version == version + 1
+    assert sorted(bulk.get_all_nodes()) == sorted(individual.get_all_nodes())
+    for name, _ in COMPLEX_EDGES:
+        assert bulk.get_dependencies(name) == individual.get_dependencies(name)
+
+
+def test_add_node_interns_names() -> None:
+    """测试节点名和依赖名被驻留."""
+    graph = DependencyGraph()
+    # 运行时拼接的字符串默认不会被驻留
+    name = "".join(["mod", "ule_x"])
+    dep = "".join(["mod", "ule_y"])
+    graph.add_node(name, [dep])
+
+    nodes = graph.get_all_nodes()
+    assert nodes[0] is sys.intern("module_x")
+    assert nodes[1] is sys.intern("module_y")
+
+
 def test_add_module_with_single_dependency() -> None:
     """测试添加有单个依赖的模块."""
     graph = DependencyGraph()
@@ -76,42 +170,22 @@ def test_topological_sort_single_module() -> None:
     assert result == ["module1"]
 
 
-def test_topological_sort_linear_dependencies() -> None:
+def test_topological_sort_linear_dependencies(linear_graph: DependencyGraph) -> None:
     """测试线性依赖链的拓扑排序."""
-    graph = DependencyGraph()
-    graph.add_node("a", [])
-    graph.add_node("b", ["a"])
-    graph.add_node("c", ["b"])
-    graph.add_node("d", ["c"])
-
-    result = graph.topological_sort()
+    result = linear_graph.topological_sort()
 
     # 验证顺序：a 必须在 b 前面，b 必须在 c 前面，c 必须在 d 前面
-    assert result.index("a") < result.index("b")
-    assert result.index("b") < result.index("c")
-    assert result.index("c") < result.index("d")
+    _assert_order(result, [("a", "b"), ("b", "c"), ("c", "d")])
 
 
-def test_topological_sort_diamond_dependencies() -> None:
+def test_topological_sort_diamond_dependencies(diamond_graph: DependencyGraph) -> None:
     """测试菱形依赖的拓扑排序."""
-    graph = DependencyGraph()
-    #     a
-    #    / \
-    #   b   c
-    #    \ /
-    #     d
-    graph.add_node("a", [])
-    graph.add_node("b", ["a"])
-    graph.add_node("c", ["a"])
-    graph.add_node("d", ["b", "c"])
-
-    result = graph.topological_sort()
+    result = diamond_graph.topological_sort()
 
     # a 必须在最前面
     assert result[0] == "a"
     # b 和 c 必须在 d 前面
-    assert result.index("b") < result.index("d")
-    assert result.index("c") < result.index("d")
+    _assert_order(result, [("b", "d"), ("c", "d")])
 
 
 def test_topological_sort_multiple_roots() -> None:
@@ -125,47 +199,28 @@ def test_topological_sort_multiple_roots() -> None:
     result = graph.topological_sort()
 
     # 验证依赖关系
-    assert result.index("root1") < result.index("child1")
-    assert result.index("root2") < result.index("child2")
-
-
-def test_circular_dependency_direct() -> None:
-    """测试直接循环依赖检测."""
-    graph = DependencyGraph()
-    graph.add_node("a", [])
-    graph.add_node("b", ["a"])
-    graph.add_node("a", ["b"])  # 修改 a 使其依赖 b，形成循环 a->b->a
-
-    # 循环依赖在拓扑排序时被检测
-    with pytest.raises(CircularDependencyError) as exc_info:
-        graph.topological_sort()
-
-    error_msg = str(exc_info.value)
-    assert "循环依赖" in error_msg or "Circular" in error_msg
-
-
-def test_circular_dependency_indirect() -> None:
-    """测试间接循环依赖检测."""
+    _assert_order(result, [("root1", "child1"), ("root2", "child2")])
+
+
+@pytest.mark.parametrize(
+    ("edges", "match"),
+    [
+        # 先添加 a，再修改 a 使其依赖 b，形成循环 a->b->a
+        pytest.param([("a", []), ("b", ["a"]), ("a", ["b"])], "检测到循环依赖", id="direct"),
+        # a -> b -> c -> a
+        pytest.param(
+            [("a", []), ("b", ["a"]), ("c", ["b"]), ("a", ["c"])], "检测到循环依赖", id="indirect"
+        ),
+        pytest.param([("a", ["a"])], "a -> a", id="self_dependency"),
+    ],
+)
+def test_circular_dependency(edges: list[tuple[str, list[str]]], match: str) -> None:
+    """测试循环依赖在拓扑排序时被检测."""
     graph = DependencyGraph()
+    for name, deps in edges:
+        graph.add_node(name, deps)
 
-    # 创建循环: a -> b -> c -> a
-    graph.add_node("a", [])
-    graph.add_node("b", ["a"])
-    graph.add_node("c", ["b"])
-    graph.add_node("a", ["c"])  # 修改 a 使其依赖 c，形成循环
-
-    # 循环依赖在拓扑排序时被检测
-    with pytest.raises(CircularDependencyError):
-        graph.topological_sort()
-
-
-def test_self_dependency() -> None:
-    """测试自我依赖检测."""
-    graph = DependencyGraph()
-
-    # 自依赖会导致循环
-    graph.add_node("a", ["a"])
-    with pytest.raises(CircularDependencyError):
+    with pytest.raises(CircularDependencyError, match=match):
         graph.topological_sort()
 
 
@@ -184,21 +239,48 @@ def test_update_module_dependencies() -> None:
     assert "base2" in deps
 
 
-def test_graph_caching() -> None:
-    """测试拓扑排序的缓存机制."""
+def test_get_dependencies_returns_shared_frozen_snapshot() -> None:
+    """测试依赖快照在图未修改时被复用，修改后反映新依赖."""
     graph = DependencyGraph()
-    graph.add_node("a", [])
-    graph.add_node("b", ["a"])
+    graph.add_node("module", ["base"])
 
-    # 第一次排序
-    result1 = graph.topological_sort()
+    first = graph.get_dependencies("module")
+    assert type(first) is frozenset
+    assert graph.get_dependencies("module") is first
 
-    # 第二次排序（应该使用缓存）
-    result2 = graph.topological_sort()
+    graph.add_node("module", ["base2"])
+    assert graph.get_dependencies("module") == {"base", "base2"}
+    # 旧快照不受后续修改影响
+    assert first == {"base"}
+
+
+def test_graph_caching(diamond_graph: DependencyGraph) -> None:
+    """测试拓扑排序的缓存机制."""
+    # fixture 构建时已完成第一次排序，这里应直接命中缓存
+    result1 = diamond_graph.topological_sort()
+    result2 = diamond_graph.topological_sort()
 
     assert result1 == result2
 
 
+def test_graph_version_tracks_mutations() -> None:
+    """测试结构版本号只在修改图时递增."""
+    graph = DependencyGraph()
+    initial = graph.version
+
+    graph.add_node("a", [])
+    after_add = graph.version
+    assert after_add > initial
+
+    # 排序（包括命中缓存）不改变版本号
+    graph.topological_sort()
+    graph.topological_sort()
+    assert graph.version == after_add
+
+    graph.remove_node("a")
+    assert graph.version > after_add
+
+
 def test_graph_cache_invalidation() -> None:
     """测试缓存失效."""
     graph = DependencyGraph()
@@ -216,41 +298,26 @@ def test_graph_cache_invalidation() -> None:
     assert result1 != result2
 
 
-def test_complex_dependency_graph() -> None:
+def test_complex_dependency_graph(complex_graph: DependencyGraph) -> None:
     """测试复杂依赖图."""
-    graph = DependencyGraph()
-
-    # 创建复杂的依赖关系
-    #       a
-    #      / \
-    #     b   c
-    #    / \ / \
-    #   d   e   f
-    #    \ / \ /
-    #     g   h
-
-    graph.add_node("a", [])
-    graph.add_node("b", ["a"])
-    graph.add_node("c", ["a"])
-    graph.add_node("d", ["b"])
-    graph.add_node("e", ["b", "c"])
-    graph.add_node("f", ["c"])
-    graph.add_node("g", ["d", "e"])
-    graph.add_node("h", ["e", "f"])
-
-    result = graph.topological_sort()
+    result = complex_graph.topological_sort()
 
     # 验证基本的依赖关系
-    assert result.index("a") < result.index("b")
-    assert result.index("a") < result.index("c")
-    assert result.index("b") < result.index("d")
-    assert result.index("b") < result.index("e")
-    assert result.index("c") < result.index("e")
-    assert result.index("c") < result.index("f")
-    assert result.index("d") < result.index("g")
-    assert result.index("e") < result.index("g")
-    assert result.index("e") < result.index("h")
-    assert result.index("f") < result.index("h")
+    _assert_order(
+        result,
+        [
+            ("a", "b"),
+            ("a", "c"),
+            ("b", "d"),
+            ("b", "e"),
+            ("c", "e"),
+            ("c", "f"),
+            ("d", "g"),
+            ("e", "g"),
+            ("e", "h"),
+            ("f", "h"),
+        ],
+    )
 
 
 def test_get_dependents() -> None:
@@ -261,15 +328,119 @@ def test_get_dependents() -> None:
     graph.add_node("dep2", ["base"])
     graph.add_node("dep3", ["dep1"])
 
-    # DependencyGraph 不提供 get_dependents 方法
-    # 我们可以通过拓扑排序和依赖关系来验证
+    # 直接反向依赖
+    assert graph.get_dependents("base") == {"dep1", "dep2"}
+    assert graph.get_dependents("dep3") == frozenset()
+
+    # 传递反向依赖：base 的依赖者及其依赖者
+    assert graph.get_reverse_dependencies("base") == {
+        "base": {"dep1", "dep2"},
+        "dep1": {"dep3"},
+    }
+    assert graph.get_reverse_dependencies("dep3") == {}
+
     result = graph.topological_sort()
 
     # base 应该在 dep1 和 dep2 之前
-    assert result.index("base") < result.index("dep1")
-    assert result.index("base") < result.index("dep2")
+    _assert_order(result, [("base", "dep1"), ("base", "dep2")])
     # dep1 应该在 dep3 之前
-    assert result.index("dep1") < result.index("dep3")
+    _assert_order(result, [("dep1", "dep3")])
+
+
+def test_remove_node_updates_dependents(diamond_graph: DependencyGraph) -> None:
+    """测试移除节点后反向索引与依赖关系保持一致."""
+    graph = diamond_graph.copy()
+
+    graph.remove_node("b")
+
+    assert graph.get_dependents("a") == {"c"}
+    assert graph.get_dependencies("d") == {"c"}
+    assert graph.get_reverse_dependencies("a") == {"a": {"c"}, "c": {"d"}}
+    assert graph.topological_sort() == ["a", "c", "d"]
+
+
+def test_copy_is_independent(diamond_graph: DependencyGraph) -> None:
+    """测试复制的依赖图与原图互不影响."""
+    graph_copy = diamond_graph.copy()
+
+    assert graph_copy.topological_sort() == diamond_graph.topological_sort()
+
+    # 修改副本不影响原图
+    graph_copy.add_node("d", ["e"])
+    graph_copy.remove_node("b")
+    assert diamond_graph.get_dependencies("d") == {"b", "c"}
+    assert not diamond_graph.has_node("e")
+    assert graph_copy.get_dependencies("d") == {"c", "e"}
+
+
+def test_get_reverse_dependencies_transitive(complex_graph: DependencyGraph) -> None:
+    """测试复杂依赖图中的传递反向依赖."""
+    assert complex_graph.get_reverse_dependencies("c") == {
+        "c": {"e", "f"},
+        "e": {"g", "h"},
+        "f": {"h"},
+    }
+    assert complex_graph.get_reverse_dependencies("missing") == {}
+
+
+def test_find_cycle_on_acyclic_graph(complex_graph: DependencyGraph) -> None:
+    """测试无环图的环查找返回 None."""
+    assert complex_graph.find_cycle() is None
+
+
+@pytest.mark.parametrize(
+    ("edges", "cycle_nodes"),
+    [
+        pytest.param([("a", ["a"])], {"a"}, id="self"),
+        pytest.param([("a", ["b"]), ("b", ["c"]), ("c", ["a"])], {"a", "b", "c"}, id="triangle"),
+        pytest.param(
+            [("root", []), ("x", ["root", "y"]), ("y", ["x"])], {"x", "y"}, id="with-tail"
+        ),
+    ],
+)
+def test_find_cycle_returns_closed_path(
+    edges: list[tuple[str, list[str]]], cycle_nodes: set[str]
+) -> None:
+    """测试环查找返回首尾相同且只包含环上节点的路径."""
+    graph = DependencyGraph()
+    for name, deps in edges:
+        graph.add_node(name, deps)
+
+    cycle = graph.find_cycle()
+
+    assert cycle is not None
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == cycle_nodes
+    # 路径上相邻节点之间确实存在依赖边
+    for node, dep in pairwise(cycle):
+        assert dep in graph.get_dependencies(node)
+
+
+@pytest.mark.parametrize(
+    ("name", "dependency", "creates_cycle"),
+    [
+        pytest.param("a", "h", True, id="transitive"),
+        pytest.param("g", "g", True, id="self"),
+        pytest.param("h", "g", False, id="sibling"),
+        pytest.param("g", "a", False, id="existing-direction"),
+        pytest.param("a", "unknown", False, id="unknown-node"),
+    ],
+)
+def test_would_create_cycle(
+    complex_graph: DependencyGraph, name: str, dependency: str, creates_cycle: bool
+) -> None:
+    """测试新增依赖边的可达性探测."""
+    cycle = complex_graph.would_create_cycle(name, dependency)
+    if not creates_cycle:
+        assert cycle is None
+        return
+
+    # 路径以待添加的边开头并回到起点，其余相邻节点之间都是已有的依赖边
+    assert cycle is not None
+    assert cycle[:2] == [name, dependency]
+    assert cycle[-1] == name
+    for node, dep in pairwise(cycle[1:]):
+        assert dep in complex_graph.get_dependencies(node)
 
 
 def test_isolated_modules() -> None:
@@ -286,3 +457,22 @@ def test_isolated_modules() -> None:
     assert "isolated1" in result
     assert "isolated2" in result
     assert "isolated3" in result
+
+
+@pytest.mark.parametrize(
+    ("graph_fixture", "edges"),
+    [
+        ("linear_graph", LINEAR_EDGES),
+        ("diamond_graph", DIAMOND_EDGES),
+        ("complex_graph", COMPLEX_EDGES),
+    ],
+)
+def test_prebuilt_graph_respects_all_edges(
+    request: pytest.FixtureRequest, graph_fixture: str, edges: list[tuple[str, list[str]]]
+) -> None:
+    """测试预构建依赖图的排序结果满足所有依赖边."""
+    graph: DependencyGraph = request.getfixturevalue(graph_fixture)
+    result = graph.topological_sort()
+
+    assert sorted(result) == sorted(name for name, _ in edges)
+    _assert_order(result, [(dep, name) for name, deps in edges for dep in deps])
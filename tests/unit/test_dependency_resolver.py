@@ -0,0 +1,126 @@
+"""依赖解析器测试.
+
+测试覆盖：
+- 加载顺序
+- 缺失依赖
+- 循环依赖
+- 加载顺序缓存
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from symphra_modules import Module
+from symphra_modules.core.exceptions import (
+    CircularDependencyError,
+    DependencyError,
+    DependencyErrorKind,
+)
+from symphra_modules.dependency import DependencyResolver
+
+
+def _modules(edges: dict[str, list[str]]) -> dict[str, type[Module]]:
+    """按 {模块名: 依赖列表} 生成可用模块表."""
+    return {
+        name: type(f"{name.title()}Module", (Module,), {"name": name, "dependencies": deps})
+        for name, deps in edges.items()
+    }
+
+
+def test_resolve_load_order() -> None:
+    """测试依赖总是排在依赖者之前，且只包含可达模块."""
+    available = _modules({"a": ["b", "c"], "b": ["c"], "c": [], "unrelated": []})
+
+    order = DependencyResolver().resolve("a", available)
+
+    assert order == ["c", "b", "a"]
+
+
+@pytest.mark.parametrize(
+    ("edges", "target", "kind"),
+    [
+        pytest.param({"a": []}, "missing", DependencyErrorKind.NOT_FOUND, id="missing_target"),
+        pytest.param(
+            {"a": ["b"], "b": ["missing"]},
+            "a",
+            DependencyErrorKind.MISSING,
+            id="missing_transitive_dependency",
+        ),
+        pytest.param(
+            {"a": ["b"], "b": ["c"], "c": ["a"]}, "a", DependencyErrorKind.CYCLE, id="circular"
+        ),
+        pytest.param({"a": ["a"]}, "a", DependencyErrorKind.CYCLE, id="self_dependency"),
+    ],
+)
+def test_resolve_errors(
+    edges: dict[str, list[str]], target: str, kind: DependencyErrorKind
+) -> None:
+    """测试缺失依赖和循环依赖按错误码区分."""
+    with pytest.raises((CircularDependencyError, DependencyError)) as exc_info:
+        DependencyResolver().resolve(target, _modules(edges))
+
+    error = exc_info.value
+    assert isinstance(error, CircularDependencyError | DependencyError)
+    assert error.kind is kind
+
+
+def test_resolve_cached_skips_traversal(monkeypatch: pytest.MonkeyPatch) -> None:
+    """测试同一模块表上重复解析命中缓存，不再遍历依赖."""
+    resolver = DependencyResolver()
+    available = _modules({"a": ["b"], "b": []})
+    first = resolver.resolve("a", available)
+
+    def _fail(*_args: object) -> None:
+        raise AssertionError("缓存命中时不应遍历依赖")
+
+    monkeypatch.setattr(DependencyResolver, "_collect_nodes", staticmethod(_fail))
+
+    second = resolver.resolve("a", available)
+    assert second == first == ["b", "a"]
+    # 返回副本，修改结果不影响缓存
+    second.clear()
+    assert resolver.resolve("a", available) == ["b", "a"]
+
+
+def test_resolve_cached_rebuilds_graph() -> None:
+    """测试缓存命中时依赖图仍对应被解析的模块."""
+    resolver = DependencyResolver()
+    available = _modules({"a": ["b"], "b": [], "c": []})
+    resolver.resolve("a", available)
+    resolver.resolve("c", available)
+
+    resolver.resolve("a", available)
+
+    assert resolver.get_graph().topological_sort() == ["b", "a"]
+
+
+def test_resolve_detects_in_place_changes() -> None:
+    """测试原地修改模块表后无需 invalidate 也不会返回过期的加载顺序."""
+    resolver = DependencyResolver()
+    available = _modules({"a": ["b"], "b": [], "c": []})
+    assert resolver.resolve("a", available) == ["b", "a"]
+
+    # 替换为依赖不同的模块类
+    available["a"] = _modules({"a": ["c"]})["a"]
+    assert resolver.resolve("a", available) == ["c", "a"]
+
+    # 原地修改模块类的依赖列表
+    available["a"].dependencies.append("b")
+    assert set(resolver.resolve("a", available)) == {"a", "b", "c"}
+
+    # 删除被依赖的模块
+    del available["b"]
+    with pytest.raises(DependencyError):
+        resolver.resolve("a", available)
+
+
+def test_resolve_invalidate() -> None:
+    """测试 invalidate 清空缓存后重新解析结果不变."""
+    resolver = DependencyResolver()
+    available = _modules({"a": ["b"], "b": []})
+    first = resolver.resolve("a", available)
+
+    resolver.invalidate()
+
+    assert resolver.resolve("a", available) == first
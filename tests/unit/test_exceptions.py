@@ -0,0 +1,86 @@
+"""核心异常单元测试.
+
+测试异常的属性、默认值和错误消息。
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from symphra_modules.core.exceptions import (
+    CircularDependencyError,
+    DependencyError,
+    DependencyErrorKind,
+    LoaderError,
+    ModuleNotFoundError,
+    ModuleStateError,
+)
+
+
+class TestDependencyError:
+    """测试依赖错误异常."""
+
+    def test_default_missing_deps(self) -> None:
+        """测试未提供缺失依赖时默认为空列表."""
+        error = DependencyError("a")
+
+        assert error.module_name == "a"
+        assert error.missing_deps == []
+        # 延迟创建的列表在多次访问之间保持同一对象
+        error.missing_deps.append("b")
+        assert error.missing_deps == ["b"]
+        assert str(error) == "模块 'a' 存在依赖错误"
+
+    def test_missing_deps_message(self) -> None:
+        """测试缺失依赖出现在错误消息中."""
+        error = DependencyError("a", missing_deps=["b", "c"])
+
+        assert error.missing_deps == ["b", "c"]
+        assert "b、c" in str(error)
+
+    def test_kind(self) -> None:
+        """测试错误码按是否有缺失依赖区分."""
+        assert DependencyError("a").kind is DependencyErrorKind.NOT_FOUND
+        assert DependencyError("a", missing_deps=["b"]).kind is DependencyErrorKind.MISSING
+
+
+class TestCircularDependencyError:
+    """测试循环依赖异常."""
+
+    def test_format_cycle(self) -> None:
+        """测试循环路径格式化结果与错误消息一致."""
+        error = CircularDependencyError(["module_a", "module_b", "module_c", "module_a"])
+
+        assert error.format_cycle() == "module_a -> module_b -> module_c -> module_a"
+        assert error.format_cycle() in str(error)
+        assert error.kind is DependencyErrorKind.CYCLE
+
+
+class TestSerialization:
+    """测试异常在 pickle 和复制后保留全部属性（跨进程传递、日志记录时需要）."""
+
+    @pytest.mark.parametrize("clone", [copy.copy, lambda e: pickle.loads(pickle.dumps(e))])
+    def test_round_trip(self, clone: object) -> None:
+        """测试各异常的属性与消息在往返后保持不变."""
+        cause = ValueError("bad")
+        errors = [
+            (CircularDependencyError(["a", "b", "a"]), ("cycle",)),
+            (DependencyError("m", ["x"]), ("module_name", "missing_deps", "kind")),
+            (DependencyError("m"), ("module_name", "missing_deps", "kind")),
+            (ModuleNotFoundError("x", module_name="m"), ("module_name",)),
+            (
+                ModuleStateError("x", "m", "loaded", "started"),
+                ("module_name", "current_state", "expected_state"),
+            ),
+            (LoaderError("x", file_path="/p", cause=cause), ("file_path",)),
+        ]
+        for error, attrs in errors:
+            restored = clone(error)  # type: ignore[operator]
+            assert type(restored) is type(error)
+            assert str(restored) == str(error)
+            for attr in attrs:
+                assert getattr(restored, attr) == getattr(error, attr), (type(error), attr)
+
+        restored_cycle = clone(errors[0][0])  # type: ignore[operator]
+        assert restored_cycle.format_cycle() == "a -> b -> a"
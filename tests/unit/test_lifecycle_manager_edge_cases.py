@@ -6,7 +6,9 @@
 - 异步方法的特殊路径
 """
 
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -15,182 +17,106 @@ from symphra_modules.core import ModuleState
 from symphra_modules.core.exceptions import ModuleNotFoundError, ModuleStateError
 from symphra_modules.lifecycle.manager import LifecycleManager
 
+from ._fixture_modules import (
+    TEMPLATE_BARE,
+    TEMPLATE_WITH_ASYNC_START,
+    TEMPLATE_WITH_BOOTSTRAP,
+    TEMPLATE_WITH_START,
+)
 
-def test_start_nonexistent_module() -> None:
-    """测试启动不存在的模块."""
-    manager = LifecycleManager()
+if TYPE_CHECKING:
+    from .conftest import ModuleDirFactory
 
-    with pytest.raises(ModuleNotFoundError, match="模块 'nonexistent' 未创建实例"):
-        manager.start_module("nonexistent")
+pytestmark = pytest.mark.xdist_group("manager_fs")
 
 
-def test_start_already_started_module(tmp_path: Path) -> None:
-    """测试启动已经启动的模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
+def _new_manager(module_dir: ModuleDirFactory, template: str) -> ModuleManager:
+    """基于只含 test 模块的共享只读目录创建新的管理器（每个测试独立）."""
+    return ModuleManager(module_dir({"test": template}))
 
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-"""
-    )
 
-    manager = ModuleManager(tmp_path)
-    manager.load("test")
-    manager.start("test")
-
-    # 再次启动，应该跳过并记录警告
-    manager.start("test")
-
-    # 验证状态仍然是STARTED
-    module = manager.get_module("test")
+def _assert_state(manager: ModuleManager, name: str, expected: ModuleState) -> None:
+    """断言模块已加载且处于期望状态."""
+    module = manager.get_module(name)
     assert module is not None
-    assert module.state == ModuleState.STARTED
-
-
-def test_start_module_with_invalid_state(tmp_path: Path) -> None:
-    """测试从无效状态启动模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
-    module = manager.load("test")
-
-    # 手动设置为DISABLED状态
-    module._state = ModuleState.DISABLED
-
-    # 尝试启动应该失败
-    with pytest.raises(ModuleStateError, match="无法启动模块"):
-        manager.start("test")
+    assert module.state is expected
 
 
-def test_stop_nonexistent_module() -> None:
-    """测试停止不存在的模块."""
+@pytest.mark.parametrize("method", ["start_module", "stop_module", "bootstrap_module"])
+def test_operate_nonexistent_module(method: str) -> None:
+    """测试对不存在的模块执行生命周期操作."""
     manager = LifecycleManager()
 
     with pytest.raises(ModuleNotFoundError, match="模块 'nonexistent' 未创建实例"):
-        manager.stop_module("nonexistent")
-
-
-def test_stop_not_started_module(tmp_path: Path) -> None:
-    """测试停止未启动的模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
-    manager.load("test")
-
-    # 停止未启动的模块，应该跳过并记录警告
-    manager.stop("test")
+        getattr(manager, method)("nonexistent")
 
-    # 验证状态仍然是LOADED
-    module = manager.get_module("test")
-    assert module is not None
-    assert module.state == ModuleState.LOADED
 
-
-def test_bootstrap_nonexistent_module() -> None:
-    """测试bootstrap不存在的模块."""
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize("method", ["start_module_async", "stop_module_async"])
+async def test_operate_async_nonexistent_module(method: str) -> None:
+    """测试对不存在的模块执行异步生命周期操作."""
     manager = LifecycleManager()
 
     with pytest.raises(ModuleNotFoundError, match="模块 'nonexistent' 未创建实例"):
-        manager.bootstrap_module("nonexistent")
-
-
-def test_bootstrap_already_initialized_module(tmp_path: Path) -> None:
-    """测试bootstrap已经初始化的模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    def bootstrap(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+        await getattr(manager, method)("nonexistent")
+
+
+@pytest.mark.parametrize(
+    ("op", "final_state", "template"),
+    [
+        ("start", ModuleState.STARTED, TEMPLATE_WITH_START),
+        ("bootstrap", ModuleState.INITIALIZED, TEMPLATE_WITH_BOOTSTRAP),
+    ],
+)
+def test_already_in_state(
+    module_dir: ModuleDirFactory, op: str, final_state: ModuleState, template: str
+) -> None:
+    """测试对已处于目标状态的模块重复执行操作（应跳过）."""
+    manager = _new_manager(module_dir, template)
     manager.load("test")
-    manager.bootstrap("test")
-
-    # 再次bootstrap，应该跳过并记录警告
-    manager.bootstrap("test")
+    getattr(manager, op)("test")
 
-    # 验证状态仍然是INITIALIZED
-    module = manager.get_module("test")
-    assert module is not None
-    assert module.state == ModuleState.INITIALIZED
+    # 再次执行，应该跳过并记录日志
+    getattr(manager, op)("test")
 
+    _assert_state(manager, "test", final_state)
 
-def test_bootstrap_with_invalid_state(tmp_path: Path) -> None:
-    """测试从无效状态bootstrap模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
 
-    manager = ModuleManager(tmp_path)
+@pytest.mark.parametrize(
+    ("op", "match"),
+    [
+        ("start", "无法启动模块"),
+        ("bootstrap", "无法初始化模块"),
+    ],
+)
+def test_operate_with_invalid_state(module_dir: ModuleDirFactory, op: str, match: str) -> None:
+    """测试从无效状态执行生命周期操作."""
+    manager = _new_manager(module_dir, TEMPLATE_BARE)
     module = manager.load("test")
 
     # 手动设置为DISABLED状态
     module._state = ModuleState.DISABLED
 
-    # 尝试bootstrap应该失败
-    with pytest.raises(ModuleStateError, match="无法初始化模块"):
-        manager.bootstrap("test")
+    # 操作应该失败
+    with pytest.raises(ModuleStateError, match=match):
+        getattr(manager, op)("test")
 
 
-def test_remove_instance(tmp_path: Path) -> None:
-    """测试移除模块实例."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
+def test_stop_not_started_module(module_dir: ModuleDirFactory) -> None:
+    """测试停止未启动的模块."""
+    manager = _new_manager(module_dir, TEMPLATE_BARE)
+    manager.load("test")
 
-    manager = ModuleManager(tmp_path)
+    # 停止未启动的模块，应该跳过并记录警告
+    manager.stop("test")
+
+    # 验证状态仍然是LOADED
+    _assert_state(manager, "test", ModuleState.LOADED)
+
+
+def test_remove_instance(module_dir: ModuleDirFactory) -> None:
+    """测试移除模块实例."""
+    manager = _new_manager(module_dir, TEMPLATE_BARE)
     manager.load("test")
 
     # 验证实例存在
@@ -203,62 +129,34 @@ class TestModule(Module):
     assert manager._lifecycle.get_instance("test") is None
 
 
-@pytest.mark.asyncio
-async def test_start_async_nonexistent_module() -> None:
-    """测试异步启动不存在的模块."""
-    manager = LifecycleManager()
-
-    with pytest.raises(ModuleNotFoundError, match="模块 'nonexistent' 未创建实例"):
-        await manager.start_module_async("nonexistent")
-
-
-@pytest.mark.asyncio
-async def test_start_async_already_started_module(tmp_path: Path) -> None:
-    """测试异步启动已经启动的模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    async def start_async(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+@pytest.mark.parametrize(
+    ("op", "final_state", "template"),
+    [
+        ("start_async", ModuleState.STARTED, TEMPLATE_WITH_ASYNC_START),
+    ],
+)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_already_in_state_async(
+    module_dir: ModuleDirFactory,
+    op: str,
+    final_state: ModuleState,
+    template: str,
+) -> None:
+    """测试对已处于目标状态的模块重复执行异步操作（应跳过）."""
+    manager = _new_manager(module_dir, template)
     await manager.load_async("test")
-    await manager.start_async("test")
+    await getattr(manager, op)("test")
 
-    # 再次启动，应该跳过
-    await manager.start_async("test")
+    # 再次执行，应该跳过
+    await getattr(manager, op)("test")
 
-    # 验证状态仍然是STARTED
-    module = manager.get_module("test")
-    assert module is not None
-    assert module.state == ModuleState.STARTED
+    _assert_state(manager, "test", final_state)
 
 
-@pytest.mark.asyncio
-async def test_start_async_with_invalid_state(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_start_async_with_invalid_state(module_dir: ModuleDirFactory) -> None:
     """测试从无效状态异步启动模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = _new_manager(module_dir, TEMPLATE_BARE)
     module = await manager.load_async("test")
 
     # 手动设置为DISABLED状态
@@ -269,37 +167,14 @@ class TestModule(Module):
         await manager.start_async("test")
 
 
-@pytest.mark.asyncio
-async def test_stop_async_nonexistent_module() -> None:
-    """测试异步停止不存在的模块."""
-    manager = LifecycleManager()
-
-    with pytest.raises(ModuleNotFoundError, match="模块 'nonexistent' 未创建实例"):
-        await manager.stop_module_async("nonexistent")
-
-
-@pytest.mark.asyncio
-async def test_stop_async_not_started_module(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stop_async_not_started_module(module_dir: ModuleDirFactory) -> None:
     """测试异步停止未启动的模块."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = _new_manager(module_dir, TEMPLATE_BARE)
     await manager.load_async("test")
 
     # 停止未启动的模块，应该跳过
     await manager.stop_async("test")
 
     # 验证状态仍然是LOADED
-    module = manager.get_module("test")
-    assert module is not None
-    assert module.state == ModuleState.LOADED
+    _assert_state(manager, "test", ModuleState.LOADED)
@@ -1,24 +1,97 @@
 """测试文件系统加载器."""
 
-from pathlib import Path
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
 
 import pytest
 
 from symphra_modules.core.exceptions import LoaderError
 from symphra_modules.loader.filesystem import FileSystemLoader
 
+from ._fixture_modules import TEMPLATE_BARE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from ._fixture_modules import ModulesWriter, ModuleWriter
+    from .conftest import ScratchFactory
+
+pytestmark = pytest.mark.xdist_group("loader_fs")
+
+# 测试模块源码（模块级常量，避免在每个测试中重复构造）
+_MODULE_CLASS_TEMPLATE = """
+from symphra_modules import Module
+
+class {class_name}(Module):
+    name = "{name}"
+    version = "1.0.0"
+    dependencies = []
+"""
+_SRC_PRIVATE = _MODULE_CLASS_TEMPLATE.format(class_name="PrivateModule", name="private")
+_SRC_PUBLIC = _MODULE_CLASS_TEMPLATE.format(class_name="PublicModule", name="public")
+_SRC_MODULE1 = _MODULE_CLASS_TEMPLATE.format(class_name="Module1", name="module1")
+_SRC_MODULE2 = _MODULE_CLASS_TEMPLATE.format(class_name="Module2", name="module2")
+_SRC_MULTI = _SRC_MODULE1 + _SRC_MODULE2.removeprefix("\nfrom symphra_modules import Module\n")
+_SRC_NO_MODULE = """
+# 这个文件不包含Module子类
+def some_function():
+    pass
+
+class SomeClass:
+    pass
+"""
+_SRC_NO_NAME = """
+from symphra_modules import Module
+
+class NoNameModule(Module):
+    # 没有定义name属性
+    version = "1.0.0"
+    dependencies = []
+"""
 
-def test_discover_empty_directory(tmp_path: Path) -> None:
+
+# 本文件写入磁盘的模块文件名（加载器以文件名为键注册到 sys.modules）
+_FIXTURE_STEMS = (
+    "test",
+    "public",
+    "_private",
+    "module1",
+    "module2",
+    "invalid",
+    "nomodule",
+    "multi",
+    "noname",
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_fixture_modules() -> Iterator[None]:
+    """测试结束后恢复本文件模块文件名对应的 sys.modules 条目.
+
+    只处理 ``_FIXTURE_STEMS`` 中的名称，测试期间导入的其他模块保持不动。
+    """
+    saved = {name: sys.modules.get(name) for name in _FIXTURE_STEMS}
+    yield
+    for name, module in saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
+def test_discover_empty_directory(empty_fs_loader: FileSystemLoader) -> None:
     """测试发现空目录."""
-    loader = FileSystemLoader([tmp_path])
-    modules = loader.discover()
+    modules = empty_fs_loader.discover()
 
     assert modules == {}
 
 
-def test_discover_nonexistent_directory(tmp_path: Path) -> None:
+def test_discover_nonexistent_directory(empty_fs_dir: Path) -> None:
     """测试发现不存在的目录."""
-    nonexistent = tmp_path / "nonexistent"
+    nonexistent = empty_fs_dir / "nonexistent"
     loader = FileSystemLoader([nonexistent])
 
     # 不应该抛异常，只记录警告
@@ -26,10 +99,10 @@ def test_discover_nonexistent_directory(tmp_path: Path) -> None:
     assert modules == {}
 
 
-def test_discover_file_instead_of_directory(tmp_path: Path) -> None:
+def test_discover_file_instead_of_directory(fast_tmp_path: Path) -> None:
     """测试路径是文件而不是目录."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test")
+    test_file = fast_tmp_path / "test.txt"
+    test_file.write_bytes(b"test")
 
     loader = FileSystemLoader([test_file])
 
@@ -38,35 +111,29 @@ def test_discover_file_instead_of_directory(tmp_path: Path) -> None:
     assert modules == {}
 
 
-def test_discover_skips_private_files(tmp_path: Path) -> None:
-    """测试跳过私有文件（以_开头）."""
-    # 创建私有模块文件
-    private_file = tmp_path / "_private.py"
-    private_file.write_text(
-        """
-from symphra_modules import Module
-
-class PrivateModule(Module):
-    name = "private"
-    version = "1.0.0"
-    dependencies = []
-"""
+@pytest.fixture(scope="module")
+def discover_dir(tmp_path_factory: pytest.TempPathFactory, write_modules: ModulesWriter) -> Path:
+    """只读的发现测试目录树（同一测试模块内只写入一次）.
+
+    - ``mixed/``: 私有模块文件和公开模块文件
+    - ``dir1/``、``dir2/``: 各包含一个模块
+    """
+    root = tmp_path_factory.mktemp("discover", numbered=False)
+    write_modules(
+        root,
+        {
+            "mixed/_private": _SRC_PRIVATE,
+            "mixed/public": _SRC_PUBLIC,
+            "dir1/module1": _SRC_MODULE1,
+            "dir2/module2": _SRC_MODULE2,
+        },
     )
+    return root
 
-    # 创建正常模块文件
-    public_file = tmp_path / "public.py"
-    public_file.write_text(
-        """
-from symphra_modules import Module
 
-class PublicModule(Module):
-    name = "public"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    loader = FileSystemLoader([tmp_path])
+def test_discover_skips_private_files(discover_dir: Path) -> None:
+    """测试跳过私有文件（以_开头）."""
+    loader = FileSystemLoader([discover_dir / "mixed"])
     modules = loader.discover()
 
     # 只应该发现公开模块
@@ -74,59 +141,42 @@ class PublicModule(Module):
     assert "private" not in modules
 
 
-def test_discover_invalid_python_file(tmp_path: Path) -> None:
+def test_discover_invalid_python_file(fast_tmp_path: Path) -> None:
     """测试发现包含语法错误的Python文件."""
-    invalid_file = tmp_path / "invalid.py"
-    invalid_file.write_text("this is { invalid python }")
+    invalid_file = fast_tmp_path / "invalid.py"
+    invalid_file.write_bytes(b"this is { invalid python }")
 
-    loader = FileSystemLoader([tmp_path])
+    loader = FileSystemLoader([fast_tmp_path])
 
     # 不应该抛异常，只记录错误
     modules = loader.discover()
     assert modules == {}
 
 
-def test_discover_file_without_module(tmp_path: Path) -> None:
+def test_discover_file_without_module(fast_tmp_path: Path, write_module: ModuleWriter) -> None:
     """测试发现不包含Module子类的文件."""
-    no_module_file = tmp_path / "nomodule.py"
-    no_module_file.write_text(
-        """
-# 这个文件不包含Module子类
-def some_function():
-    pass
-
-class SomeClass:
-    pass
-"""
+    write_module(
+        fast_tmp_path,
+        "nomodule",
+        _SRC_NO_MODULE,
     )
 
-    loader = FileSystemLoader([tmp_path])
+    loader = FileSystemLoader([fast_tmp_path])
     modules = loader.discover()
 
     # 不应该发现任何模块
     assert modules == {}
 
 
-def test_discover_multiple_modules_in_file(tmp_path: Path) -> None:
+def test_discover_multiple_modules_in_file(fast_tmp_path: Path, write_module: ModuleWriter) -> None:
     """测试发现一个文件中的多个模块."""
-    multi_file = tmp_path / "multi.py"
-    multi_file.write_text(
-        """
-from symphra_modules import Module
-
-class Module1(Module):
-    name = "module1"
-    version = "1.0.0"
-    dependencies = []
-
-class Module2(Module):
-    name = "module2"
-    version = "1.0.0"
-    dependencies = []
-"""
+    write_module(
+        fast_tmp_path,
+        "multi",
+        _SRC_MULTI,
     )
 
-    loader = FileSystemLoader([tmp_path])
+    loader = FileSystemLoader([fast_tmp_path])
     modules = loader.discover()
 
     # 应该发现两个模块
@@ -135,21 +185,11 @@ class Module2(Module):
     assert "module2" in modules
 
 
-def test_load_class_from_cache(tmp_path: Path) -> None:
+def test_load_class_from_cache(loader_scratch: ScratchFactory) -> None:
     """测试从缓存加载模块类."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
+    directory = loader_scratch(TEMPLATE_BARE)
 
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    loader = FileSystemLoader([tmp_path])
+    loader = FileSystemLoader([directory])
     loader.discover()  # 填充缓存
 
     # 从缓存加载
@@ -157,51 +197,30 @@ class TestModule(Module):
     assert module_class.name == "test"
 
 
-def test_load_class_nonexistent(tmp_path: Path) -> None:
+def test_load_class_nonexistent(empty_fs_loader: FileSystemLoader) -> None:
     """测试加载不存在的模块类."""
-    loader = FileSystemLoader([tmp_path])
-    loader.discover()
+    empty_fs_loader.discover()
 
     with pytest.raises(LoaderError, match="模块 'nonexistent' 未找到"):
-        loader.load_class("nonexistent")
+        empty_fs_loader.load_class("nonexistent")
 
 
-def test_load_class_auto_discover(tmp_path: Path) -> None:
+def test_load_class_auto_discover(loader_scratch: ScratchFactory) -> None:
     """测试加载时自动发现."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
+    directory = loader_scratch(TEMPLATE_BARE)
 
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    loader = FileSystemLoader([tmp_path])
+    loader = FileSystemLoader([directory])
 
     # 不先调用discover，直接load_class应该自动发现
     module_class = loader.load_class("test")
     assert module_class.name == "test"
 
 
-def test_reload(tmp_path: Path) -> None:
+def test_reload(loader_scratch: ScratchFactory) -> None:
     """测试重新加载."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
+    directory = loader_scratch(TEMPLATE_BARE)
 
-    loader = FileSystemLoader([tmp_path])
+    loader = FileSystemLoader([directory])
     modules1 = loader.discover()
     assert "test" in modules1
 
@@ -213,38 +232,9 @@ class TestModule(Module):
     assert "test" in modules2
 
 
-def test_discover_multiple_directories(tmp_path: Path) -> None:
+def test_discover_multiple_directories(discover_dir: Path) -> None:
     """测试发现多个目录中的模块."""
-    dir1 = tmp_path / "dir1"
-    dir2 = tmp_path / "dir2"
-    dir1.mkdir()
-    dir2.mkdir()
-
-    # 在第一个目录创建模块
-    (dir1 / "module1.py").write_text(
-        """
-from symphra_modules import Module
-
-class Module1(Module):
-    name = "module1"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    # 在第二个目录创建模块
-    (dir2 / "module2.py").write_text(
-        """
-from symphra_modules import Module
-
-class Module2(Module):
-    name = "module2"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    loader = FileSystemLoader([dir1, dir2])
+    loader = FileSystemLoader([discover_dir / "dir1", discover_dir / "dir2"])
     modules = loader.discover()
 
     # 应该发现两个目录中的所有模块
@@ -253,21 +243,15 @@ class Module2(Module):
     assert "module2" in modules
 
 
-def test_module_without_name_attribute(tmp_path: Path) -> None:
+def test_module_without_name_attribute(fast_tmp_path: Path, write_module: ModuleWriter) -> None:
     """测试没有name属性的Module子类."""
-    no_name_file = tmp_path / "noname.py"
-    no_name_file.write_text(
-        """
-from symphra_modules import Module
-
-class NoNameModule(Module):
-    # 没有定义name属性
-    version = "1.0.0"
-    dependencies = []
-"""
+    write_module(
+        fast_tmp_path,
+        "noname",
+        _SRC_NO_NAME,
     )
 
-    loader = FileSystemLoader([tmp_path])
+    loader = FileSystemLoader([fast_tmp_path])
     modules = loader.discover()
 
     # 不应该发现这个模块（因为没有name属性）
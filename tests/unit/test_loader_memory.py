@@ -0,0 +1,60 @@
+"""测试内存加载器."""
+
+from __future__ import annotations
+
+import pytest
+
+from symphra_modules import Module, ModuleManager, ModuleState
+from symphra_modules.core.exceptions import LoaderError
+from symphra_modules.loader.memory import MemoryLoader
+
+
+class AlphaModule(Module):
+    """测试模块 A."""
+
+    name = "alpha"
+
+
+class BetaModule(Module):
+    """依赖 A 的测试模块."""
+
+    name = "beta"
+    dependencies = ["alpha"]
+
+
+def test_discover_returns_copy() -> None:
+    """测试 discover 返回模块表的副本."""
+    loader = MemoryLoader([AlphaModule, BetaModule])
+
+    modules = loader.discover()
+    assert modules == {"alpha": AlphaModule, "beta": BetaModule}
+
+    modules.clear()
+    assert loader.discover() == {"alpha": AlphaModule, "beta": BetaModule}
+
+
+def test_load_class() -> None:
+    """测试加载模块类."""
+    loader = MemoryLoader([AlphaModule])
+
+    assert loader.load_class("alpha") is AlphaModule
+    with pytest.raises(LoaderError, match="未找到"):
+        loader.load_class("missing")
+
+
+def test_manager_from_modules() -> None:
+    """测试使用内存模块创建管理器并按依赖顺序加载."""
+    manager = ModuleManager.from_modules([AlphaModule, BetaModule], ignored_modules={"unused"})
+
+    assert set(manager.list_modules()) == {"alpha", "beta"}
+    manager.load("beta")
+    alpha = manager.get_module("alpha")
+    assert type(alpha) is AlphaModule
+    assert alpha.state == ModuleState.LOADED
+
+
+def test_manager_from_modules_ignored() -> None:
+    """测试内存管理器同样遵守忽略列表."""
+    manager = ModuleManager.from_modules([AlphaModule, BetaModule], ignored_modules={"beta"})
+
+    assert manager.list_modules() == ["alpha"]
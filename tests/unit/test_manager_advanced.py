@@ -8,13 +8,45 @@
 - 错误处理
 """
 
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
 from symphra_modules import Module, ModuleManager
 from symphra_modules.core.exceptions import ModuleNotFoundError
 
+from ._fixture_modules import build_module_source, encoded
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .conftest import ModuleDirFactory
+
+pytestmark = pytest.mark.xdist_group("manager_fs")
+
+# 测试模块源码（模块级常量，各测试共享）
+SIMPLE_SRC = build_module_source("simple")
+DEPENDENT_SRC = build_module_source("dependent", dependencies=("simple",))
+SIMPLE_START_STOP_SRC = """
+from symphra_modules import Module
+
+class SimpleModule(Module):
+    name = "simple"
+    version = "1.0.0"
+    dependencies = []
+
+    def start(self) -> None:
+        self.started = True
+
+    def stop(self) -> None:
+        self.stopped = True
+"""
+SIMPLE_V123_SRC = build_module_source("simple", version="1.2.3")
+VALID_NAME_SRC = build_module_source("test-module_123")
+
 
 class SimpleModule(Module):
     """简单测试模块."""
@@ -44,34 +76,23 @@ class DependentModule(Module):
         self.started = True  # type: ignore
 
 
-def test_load_all(tmp_path: Path) -> None:
-    """测试批量加载所有模块."""
-    # 创建测试模块文件
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
+@pytest.fixture(scope="module")
+def populated_manager(module_dir: ModuleDirFactory) -> ModuleManager:
+    """已发现 simple/dependent 两个模块的管理器（同一测试模块内共享，仅供只读测试使用）."""
+    return ModuleManager(module_dir({"simple": SIMPLE_SRC, "dependent": DEPENDENT_SRC}))
 
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    dependent_file = tmp_path / "dependent.py"
-    dependent_file.write_text(
-        """
-from symphra_modules import Module
 
-class DependentModule(Module):
-    name = "dependent"
-    version = "1.0.0"
-    dependencies = ["simple"]
-"""
+def test_load_all(module_dir: ModuleDirFactory) -> None:
+    """测试批量加载所有模块."""
+    # 创建测试模块文件
+    directory = module_dir(
+        {
+            "simple": SIMPLE_SRC,
+            "dependent": DEPENDENT_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     modules = manager.load_all()
 
     # 验证所有模块都已加载
@@ -85,107 +106,75 @@ class DependentModule(Module):
     assert "dependent" in loaded_modules
 
 
-def test_load_all_with_force(tmp_path: Path) -> None:
+def test_load_all_with_force(module_dir: ModuleDirFactory) -> None:
     """测试强制重新加载所有模块."""
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
+    directory = module_dir(
+        {
+            "simple": SIMPLE_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
 
     # 第一次加载
     modules1 = manager.load_all()
     instance1 = modules1["simple"]
 
-    # 强制重新加载
-    modules2 = manager.load_all(force=True)
+    # 强制重新加载：只重新实例化已发现的类，不应再次导入模块文件
+    with patch.object(manager._loader, "load_class", side_effect=AssertionError("重新导入")):
+        modules2 = manager.load_all(force=True)
     instance2 = modules2["simple"]
 
-    # 验证是新实例
+    # 验证是新实例，且复用同一个模块类
     assert instance1 is not instance2
+    assert type(instance1) is type(instance2)
 
 
-def test_start_all(tmp_path: Path) -> None:
-    """测试批量启动所有模块."""
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self) -> None:
-        self.started = True
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+def test_load_all_with_force_recreates_each_module_once(module_dir: ModuleDirFactory) -> None:
+    """测试强制批量加载时共享依赖只重新创建一次，返回的实例即当前实例."""
+    manager = ModuleManager(module_dir({"simple": SIMPLE_SRC, "dependent": DEPENDENT_SRC}))
     manager.load_all()
-    manager.start_all()
-
-    # 验证所有模块都已启动
-    started_modules = manager.list_started_modules()
-    assert "simple" in started_modules
-
-
-def test_stop_all(tmp_path: Path) -> None:
-    """测试批量停止所有模块."""
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self) -> None:
-        self.started = True
 
-    def stop(self) -> None:
-        self.stopped = True
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    create_instance = manager._lifecycle.create_instance
+    with patch.object(manager._lifecycle, "create_instance", wraps=create_instance) as created:
+        modules = manager.load_all(force=True)
+
+    # 与发现顺序无关：每个模块恰好重新创建一次
+    created_names = sorted(call.args[0].name for call in created.call_args_list)
+    assert created_names == ["dependent", "simple"]
+    assert modules == {name: manager.get_module(name) for name in ("simple", "dependent")}
+
+
+@pytest.mark.parametrize(
+    ("actions", "expected_started"),
+    [
+        (("start_all",), ["simple"]),
+        (("start_all", "stop_all"), []),
+    ],
+    ids=["start_all", "stop_all"],
+)
+def test_batch_lifecycle(
+    module_dir: ModuleDirFactory, actions: tuple[str, ...], expected_started: list[str]
+) -> None:
+    """测试批量启动/停止所有模块."""
+    manager = ModuleManager(module_dir({"simple": SIMPLE_START_STOP_SRC}))
     manager.load_all()
-    manager.start_all()
+    for action in actions:
+        getattr(manager, action)()
 
-    # 停止所有模块
-    manager.stop_all()
+    # 验证已启动的模块
+    assert manager.list_started_modules() == expected_started
 
-    # 验证所有模块都已停止
-    started_modules = manager.list_started_modules()
-    assert len(started_modules) == 0
 
-
-def test_unload(tmp_path: Path) -> None:
+def test_unload(module_dir: ModuleDirFactory) -> None:
     """测试卸载模块."""
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
+    directory = module_dir(
+        {
+            "simple": SIMPLE_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     manager.load("simple")
 
     # 验证模块已加载
@@ -198,29 +187,23 @@ class SimpleModule(Module):
     assert "simple" not in manager.list_loaded_modules()
 
 
-def test_unload_nonexistent_module(tmp_path: Path) -> None:
+def test_unload_nonexistent_module(populated_manager: ModuleManager) -> None:
     """测试卸载不存在的模块."""
-    manager = ModuleManager(tmp_path)
+    manager = populated_manager
 
     with pytest.raises(ModuleNotFoundError):
         manager.unload("nonexistent")
 
 
-def test_get_module_info(tmp_path: Path) -> None:
+def test_get_module_info(module_dir: ModuleDirFactory) -> None:
     """测试获取模块信息."""
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.2.3"
-    dependencies = []
-"""
+    directory = module_dir(
+        {
+            "simple": SIMPLE_V123_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     manager.load("simple")
 
     # 获取模块信息
@@ -234,17 +217,17 @@ class SimpleModule(Module):
     assert "loaded_at" in info
 
 
-def test_get_module_info_nonexistent(tmp_path: Path) -> None:
+def test_get_module_info_nonexistent(populated_manager: ModuleManager) -> None:
     """测试获取不存在模块的信息."""
-    manager = ModuleManager(tmp_path)
+    manager = populated_manager
 
     with pytest.raises(ModuleNotFoundError):
         manager.get_module_info("nonexistent")
 
 
-def test_validate_module_name_empty(tmp_path: Path) -> None:
+def test_validate_module_name_empty(populated_manager: ModuleManager) -> None:
     """测试空模块名称验证."""
-    manager = ModuleManager(tmp_path)
+    manager = populated_manager
 
     with pytest.raises(ValueError, match="模块名称不能为空"):
         manager.load("")
@@ -253,9 +236,9 @@ def test_validate_module_name_empty(tmp_path: Path) -> None:
         manager.load("   ")
 
 
-def test_validate_module_name_invalid_chars(tmp_path: Path) -> None:
+def test_validate_module_name_invalid_chars(populated_manager: ModuleManager) -> None:
     """测试非法字符验证."""
-    manager = ModuleManager(tmp_path)
+    manager = populated_manager
 
     # 包含非法字符
     with pytest.raises(ValueError, match="包含非法字符"):
@@ -268,30 +251,36 @@ def test_validate_module_name_invalid_chars(tmp_path: Path) -> None:
         manager.load("module name")
 
 
-def test_validate_module_name_valid(tmp_path: Path) -> None:
-    """测试合法模块名称."""
-    simple_file = tmp_path / "test-module_123.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
+def test_validate_module_name_unicode(populated_manager: ModuleManager) -> None:
+    """测试 Unicode 字母数字组成的名称合法."""
+    populated_manager._validate_module_name("模块_1")
 
-class TestModule(Module):
-    name = "test-module_123"
-    version = "1.0.0"
-    dependencies = []
-"""
+
+@pytest.mark.parametrize("name", ["name\n", "name\t"])
+def test_validate_module_name_control_chars(populated_manager: ModuleManager, name: str) -> None:
+    """测试包含换行/制表符的名称非法（包括末尾换行）."""
+    with pytest.raises(ValueError, match="包含非法字符"):
+        populated_manager._validate_module_name(name)
+
+
+def test_validate_module_name_valid(module_dir: ModuleDirFactory) -> None:
+    """测试合法模块名称."""
+    directory = module_dir(
+        {
+            "test-module_123": VALID_NAME_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
 
     # 这些名称应该是合法的
     module = manager.load("test-module_123")
     assert module.name == "test-module_123"
 
 
-def test_start_with_validation(tmp_path: Path) -> None:
+def test_start_with_validation(populated_manager: ModuleManager) -> None:
     """测试启动时的输入验证."""
-    manager = ModuleManager(tmp_path)
+    manager = populated_manager
 
     # 空名称
     with pytest.raises(ValueError, match="模块名称不能为空"):
@@ -302,28 +291,16 @@ def test_start_with_validation(tmp_path: Path) -> None:
         manager.start("invalid/name")
 
 
-def test_context_manager(tmp_path: Path) -> None:
+def test_context_manager(module_dir: ModuleDirFactory) -> None:
     """测试上下文管理器."""
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self) -> None:
-        self.started = True
-
-    def stop(self) -> None:
-        self.stopped = True
-"""
+    directory = module_dir(
+        {
+            "simple": SIMPLE_START_STOP_SRC,
+        }
     )
 
     # 使用上下文管理器
-    with ModuleManager(tmp_path) as manager:
+    with ModuleManager(directory) as manager:
         manager.load("simple")
         manager.start("simple")
         assert "simple" in manager.list_started_modules()
@@ -332,21 +309,9 @@ class SimpleModule(Module):
     # （注意：这里我们无法直接验证，但不应该抛出异常）
 
 
-def test_list_modules_thread_safe(tmp_path: Path) -> None:
+def test_list_modules_thread_safe(populated_manager: ModuleManager) -> None:
     """测试列出模块的线程安全性."""
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = populated_manager
 
     # 多次调用应该返回一致的结果
     modules1 = manager.list_modules()
@@ -364,17 +329,7 @@ def test_rediscover(tmp_path: Path) -> None:
     assert len(manager.list_modules()) == 0
 
     # 创建新模块文件
-    simple_file = tmp_path / "simple.py"
-    simple_file.write_text(
-        """
-from symphra_modules import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
+    (tmp_path / "simple.py").write_bytes(encoded(SIMPLE_SRC))
 
     # 重新发现
     manager.rediscover()
@@ -6,54 +6,88 @@
 - 异步错误处理
 """
 
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import pytest
+import pytest_asyncio
 
 from symphra_modules import ModuleManager
 from symphra_modules.core import ModuleState
 
+from ._fixture_modules import (
+    BODY_ASYNC_START,
+    BODY_ASYNC_STOP,
+    BODY_START,
+    BODY_STOP,
+    TEMPLATE_BARE,
+    build_module_source,
+)
+
+if TYPE_CHECKING:
+    from .conftest import ModuleDirFactory
+
+pytestmark = pytest.mark.xdist_group("manager_fs")
+
+# 测试模块源码（模块级常量，各测试共享）
+MODULE_SOURCES = {f"module{i}": build_module_source(f"module{i}") for i in range(3)}
+STARTED_FLAG_SRC = build_module_source(
+    body="\n    def __init__(self):\n        super().__init__()\n        self.started = False\n"
+    "\n    async def start_async(self):\n        self.started = True\n"
+)
+STOPPED_FLAG_SRC = build_module_source(
+    body="\n    def __init__(self):\n        super().__init__()\n        self.stopped = False\n"
+    + BODY_ASYNC_START
+    + "\n    async def stop_async(self):\n        self.stopped = True\n"
+)
+BASE_ASYNC_SRC = build_module_source("base", BODY_ASYNC_START)
+DEPENDENT_ASYNC_SRC = build_module_source("dependent", BODY_ASYNC_START, dependencies=("base",))
+ASYNC_START_STOP_SRC = build_module_source(body=BODY_ASYNC_START + BODY_ASYNC_STOP)
+SYNC_START_STOP_SRC = build_module_source(body=BODY_START + BODY_STOP)
+GOOD_SRC = build_module_source("good")
+BAD_SRC = build_module_source("bad", dependencies=("nonexistent",))  # 依赖不存在
+ERROR_START_SRC = build_module_source(
+    "error", '\n    async def start_async(self):\n        raise RuntimeError("Start error")\n'
+)
+ERROR_STOP_SRC = build_module_source(
+    "error",
+    BODY_ASYNC_START
+    + '\n    async def stop_async(self):\n        raise RuntimeError("Stop error")\n',
+)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def loaded_manager(module_dir: ModuleDirFactory) -> ModuleManager:
+    """已通过 load_all_async 加载 module0..2 的管理器（同一测试模块内共享，只读）."""
+    manager = ModuleManager(module_dir(MODULE_SOURCES))
+    await manager.load_all_async()
+    return manager
 
-@pytest.mark.asyncio
-async def test_load_all_async(tmp_path: Path) -> None:
-    """测试异步批量加载."""
-    # 创建多个模块
-    for i in range(3):
-        (tmp_path / f"module{i}.py").write_text(
-            f"""
-from symphra_modules import Module
-
-class Module{i}(Module):
-    name = "module{i}"
-    version = "1.0.0"
-    dependencies = []
-"""
-        )
-
-    manager = ModuleManager(tmp_path)
-    modules = await manager.load_all_async()
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_load_all_async(loaded_manager: ModuleManager) -> None:
+    """测试异步批量加载."""
     # 验证所有模块都已加载
+    assert loaded_manager.list_loaded_modules() == ["module0", "module1", "module2"]
+
+    # 再次加载（非强制）应直接返回已有实例
+    modules = await loaded_manager.load_all_async()
     assert len(modules) == 3
-    for i in range(3):
-        assert f"module{i}" in modules
+    for name, module in modules.items():
+        assert loaded_manager.get_module(name) is module
 
 
-@pytest.mark.asyncio
-async def test_load_all_async_with_force(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_load_all_async_with_force(module_dir: ModuleDirFactory) -> None:
     """测试异步强制重新加载."""
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
+    directory = module_dir(
+        {
+            "test": TEMPLATE_BARE,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
 
     # 第一次加载
     modules1 = await manager.load_all_async()
@@ -67,28 +101,16 @@ class TestModule(Module):
     assert instance1 is not instance2
 
 
-@pytest.mark.asyncio
-async def test_start_all_async(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_start_all_async(module_dir: ModuleDirFactory) -> None:
     """测试异步批量启动."""
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    def __init__(self):
-        super().__init__()
-        self.started = False
-
-    async def start_async(self):
-        self.started = True
-"""
+    directory = module_dir(
+        {
+            "test": STARTED_FLAG_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     await manager.load_all_async()
     await manager.start_all_async()
 
@@ -98,31 +120,16 @@ class TestModule(Module):
     assert module.state == ModuleState.STARTED
 
 
-@pytest.mark.asyncio
-async def test_stop_all_async(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stop_all_async(module_dir: ModuleDirFactory) -> None:
     """测试异步批量停止."""
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    def __init__(self):
-        super().__init__()
-        self.stopped = False
-
-    async def start_async(self):
-        pass
-
-    async def stop_async(self):
-        self.stopped = True
-"""
+    directory = module_dir(
+        {
+            "test": STOPPED_FLAG_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     await manager.load_all_async()
     await manager.start_all_async()
 
@@ -134,39 +141,18 @@ class TestModule(Module):
     assert len(started_modules) == 0
 
 
-@pytest.mark.asyncio
-async def test_async_with_dependencies(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_async_with_dependencies(module_dir: ModuleDirFactory) -> None:
     """测试异步操作处理依赖关系."""
     # 创建有依赖的模块
-    (tmp_path / "base.py").write_text(
-        """
-from symphra_modules import Module
-
-class BaseModule(Module):
-    name = "base"
-    version = "1.0.0"
-    dependencies = []
-
-    async def start_async(self):
-        pass
-"""
-    )
-
-    (tmp_path / "dependent.py").write_text(
-        """
-from symphra_modules import Module
-
-class DependentModule(Module):
-    name = "dependent"
-    version = "1.0.0"
-    dependencies = ["base"]
-
-    async def start_async(self):
-        pass
-"""
+    directory = module_dir(
+        {
+            "base": BASE_ASYNC_SRC,
+            "dependent": DEPENDENT_ASYNC_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     await manager.load_all_async()
     await manager.start_all_async()
 
@@ -175,86 +161,41 @@ class DependentModule(Module):
     assert "dependent" in manager.list_started_modules()
 
 
-@pytest.mark.asyncio
-async def test_async_start_single_module(tmp_path: Path) -> None:
-    """测试异步启动单个模块."""
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    async def start_async(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
-    await manager.load_async("test")
-    await manager.start_async("test")
-
-    # 验证模块已启动
-    module = manager.get_module("test")
-    assert module is not None
-    assert module.state == ModuleState.STARTED
-
-
-@pytest.mark.asyncio
-async def test_async_stop_single_module(tmp_path: Path) -> None:
-    """测试异步停止单个模块."""
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    async def start_async(self):
-        pass
-
-    async def stop_async(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    ("actions", "expected_state"),
+    [
+        (("start_async",), ModuleState.STARTED),
+        (("start_async", "stop_async"), ModuleState.STOPPED),
+    ],
+    ids=["start", "stop"],
+)
+async def test_async_single_module_lifecycle(
+    module_dir: ModuleDirFactory, actions: tuple[str, ...], expected_state: ModuleState
+) -> None:
+    """测试异步启动/停止单个模块."""
+    manager = ModuleManager(module_dir({"test": ASYNC_START_STOP_SRC}))
     await manager.load_async("test")
-    await manager.start_async("test")
-    await manager.stop_async("test")
+    for action in actions:
+        await getattr(manager, action)("test")
 
-    # 验证模块已停止
+    # 验证模块状态
     module = manager.get_module("test")
     assert module is not None
-    assert module.state == ModuleState.STOPPED
+    assert module.state == expected_state
 
 
-@pytest.mark.asyncio
-async def test_async_with_sync_fallback(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_async_with_sync_fallback(module_dir: ModuleDirFactory) -> None:
     """测试异步操作对同步模块的回退."""
     # 创建只有同步方法的模块
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-
-    def stop(self):
-        pass
-"""
+    directory = module_dir(
+        {
+            "test": SYNC_START_STOP_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     await manager.load_async("test")
     await manager.start_async("test")
 
@@ -264,33 +205,18 @@ class TestModule(Module):
     assert module.state == ModuleState.STARTED
 
 
-@pytest.mark.asyncio
-async def test_load_all_async_error_handling(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_load_all_async_error_handling(module_dir: ModuleDirFactory) -> None:
     """测试异步加载时的错误处理."""
     # 创建一个正常模块和一个有问题的模块
-    (tmp_path / "good.py").write_text(
-        """
-from symphra_modules import Module
-
-class GoodModule(Module):
-    name = "good"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    (tmp_path / "bad.py").write_text(
-        """
-from symphra_modules import Module
-
-class BadModule(Module):
-    name = "bad"
-    version = "1.0.0"
-    dependencies = ["nonexistent"]  # 依赖不存在
-"""
+    directory = module_dir(
+        {
+            "good": GOOD_SRC,
+            "bad": BAD_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
 
     # load_all_async 应该记录错误但不抛异常
     modules = await manager.load_all_async()
@@ -299,24 +225,16 @@ class BadModule(Module):
     assert "good" in modules
 
 
-@pytest.mark.asyncio
-async def test_start_all_async_error_handling(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_start_all_async_error_handling(module_dir: ModuleDirFactory) -> None:
     """测试异步启动时的错误处理."""
-    (tmp_path / "error.py").write_text(
-        """
-from symphra_modules import Module
-
-class ErrorModule(Module):
-    name = "error"
-    version = "1.0.0"
-    dependencies = []
-
-    async def start_async(self):
-        raise RuntimeError("Start error")
-"""
+    directory = module_dir(
+        {
+            "error": ERROR_START_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     await manager.load_all_async()
 
     # start_all_async 应该记录错误但不抛异常
@@ -328,27 +246,16 @@ class ErrorModule(Module):
     assert module.state != ModuleState.STARTED
 
 
-@pytest.mark.asyncio
-async def test_stop_all_async_error_handling(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stop_all_async_error_handling(module_dir: ModuleDirFactory) -> None:
     """测试异步停止时的错误处理."""
-    (tmp_path / "error.py").write_text(
-        """
-from symphra_modules import Module
-
-class ErrorModule(Module):
-    name = "error"
-    version = "1.0.0"
-    dependencies = []
-
-    async def start_async(self):
-        pass
-
-    async def stop_async(self):
-        raise RuntimeError("Stop error")
-"""
+    directory = module_dir(
+        {
+            "error": ERROR_STOP_SRC,
+        }
     )
 
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(directory)
     await manager.load_all_async()
     await manager.start_all_async()
 
@@ -6,77 +6,124 @@
 - 边缘情况处理
 """
 
-from pathlib import Path
-from unittest.mock import patch
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
 import pytest
 
-from symphra_modules import ModuleManager
+from symphra_modules import Module, ModuleManager
 from symphra_modules.core import ModuleState
 from symphra_modules.core.exceptions import ModuleNotFoundError
+from symphra_modules.dependency.graph import DependencyGraph
 
+from ._fixture_modules import (
+    BODY_BOOTSTRAP,
+    BODY_START,
+    TEMPLATE_BARE,
+    TEMPLATE_WITH_ASYNC_START,
+    TEMPLATE_WITH_START,
+    build_module_source,
+)
 
-def test_load_nonexistent_module(tmp_path: Path) -> None:
-    """测试加载不存在的模块."""
-    manager = ModuleManager(tmp_path)
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-    # 应该抛出DependencyError（因为模块不在available_modules中）
-    from symphra_modules.core.exceptions import DependencyError
+    from .conftest import ModuleDirFactory
 
-    with pytest.raises(DependencyError, match="依赖错误"):
-        manager.load("nonexistent")
+pytestmark = pytest.mark.xdist_group("manager_fs")
 
+# 测试模块源码（模块级常量，各测试共享）
+GOOD1_SRC = build_module_source("good1", BODY_START)
+BAD_SRC = build_module_source(
+    "bad", '\n    def start(self):\n        raise RuntimeError("Start failed")\n'
+)
+GOOD2_SRC = build_module_source("good2", BODY_START)
+TEST1_SRC = build_module_source("test1")
+TEST2_SRC = build_module_source("test2")
+BASE_SRC = build_module_source("base", BODY_BOOTSTRAP)
+DEPENDENT_SRC = build_module_source("dependent", BODY_BOOTSTRAP, dependencies=("base",))
 
-def test_stop_unloaded_module(tmp_path: Path) -> None:
-    """测试停止未加载的模块."""
-    manager = ModuleManager(tmp_path)
 
-    with pytest.raises(ModuleNotFoundError, match="未加载"):
-        manager.stop("nonexistent")
+class FirstModule(Module):
+    """直接注册的测试模块（无需文件发现）."""
 
+    name = "test1"
 
-@pytest.mark.asyncio
-async def test_stop_async_unloaded_module(tmp_path: Path) -> None:
-    """测试异步停止未加载的模块."""
-    manager = ModuleManager(tmp_path)
 
-    with pytest.raises(ModuleNotFoundError, match="未加载"):
-        await manager.stop_async("nonexistent")
+class SecondModule(Module):
+    """直接注册的测试模块（无需文件发现）."""
+
+    name = "test2"
+
+
+def _raise_sort_error(self: DependencyGraph) -> list[str]:
+    raise Exception("Mocked error")
+
+
+@contextmanager
+def _failing_topological_sort() -> Iterator[None]:
+    """让 DependencyGraph.topological_sort 抛出异常.
+
+    DependencyGraph 使用 __slots__，无法替换实例方法，因此临时替换类属性。
+    """
+    original = DependencyGraph.topological_sort
+    DependencyGraph.topological_sort = _raise_sort_error  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        DependencyGraph.topological_sort = original  # type: ignore[method-assign]
+
+
+def test_load_nonexistent_module() -> None:
+    """测试加载不存在的模块."""
+    manager = ModuleManager.from_modules()
 
+    # 应该抛出DependencyError（因为模块不在available_modules中）
+    from symphra_modules.core.exceptions import DependencyError
+
+    with pytest.raises(DependencyError, match="依赖错误"):
+        manager.load("nonexistent")
 
-def test_unload_unloaded_module(tmp_path: Path) -> None:
-    """测试卸载未加载的模块."""
-    manager = ModuleManager(tmp_path)
 
+@pytest.fixture(scope="module")
+def empty_manager() -> ModuleManager:
+    """没有任何模块的管理器（同一测试模块内共享，只读）."""
+    return ModuleManager.from_modules()
+
+
+@pytest.mark.parametrize(
+    ("method", "match"),
+    [
+        ("stop", "未加载"),
+        ("unload", "未加载"),
+        ("bootstrap", "未加载"),
+        ("install", "不存在"),
+        ("get_module_info", "模块不存在"),
+    ],
+)
+def test_missing_module_raises(empty_manager: ModuleManager, method: str, match: str) -> None:
+    """测试对不存在的模块执行操作时抛出 ModuleNotFoundError."""
+    with pytest.raises(ModuleNotFoundError, match=match):
+        getattr(empty_manager, method)("nonexistent")
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize("method", ["start_async", "stop_async"])
+async def test_missing_module_raises_async(empty_manager: ModuleManager, method: str) -> None:
+    """测试异步启动/停止未加载的模块时抛出 ModuleNotFoundError."""
     with pytest.raises(ModuleNotFoundError, match="未加载"):
-        manager.unload("nonexistent")
+        await getattr(empty_manager, method)("nonexistent")
 
 
-def test_start_with_dependency_resolution_error(tmp_path: Path) -> None:
+def test_start_with_dependency_resolution_error(module_dir: ModuleDirFactory) -> None:
     """测试依赖解析失败时的启动."""
-    # 创建一个模块
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test": TEMPLATE_WITH_START}))
     manager.load("test")
 
     # 模拟依赖解析失败
-    with patch.object(
-        manager._resolver.get_graph(), "topological_sort", side_effect=Exception("Mocked error")
-    ):
+    with _failing_topological_sort():
         # 即使解析失败，也应该能启动当前模块
         manager.start("test")
 
@@ -86,31 +133,14 @@ class TestModule(Module):
     assert module.state == ModuleState.STARTED
 
 
-@pytest.mark.asyncio
-async def test_start_async_with_dependency_resolution_error(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_start_async_with_dependency_resolution_error(module_dir: ModuleDirFactory) -> None:
     """测试依赖解析失败时的异步启动."""
-    module_file = tmp_path / "test.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-
-    async def start_async(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test": TEMPLATE_WITH_ASYNC_START}))
     await manager.load_async("test")
 
     # 模拟依赖解析失败
-    with patch.object(
-        manager._resolver.get_graph(), "topological_sort", side_effect=Exception("Mocked error")
-    ):
+    with _failing_topological_sort():
         # 即使解析失败，也应该能启动当前模块
         await manager.start_async("test")
 
@@ -120,73 +150,21 @@ class TestModule(Module):
     assert module.state == ModuleState.STARTED
 
 
-@pytest.mark.asyncio
-async def test_start_async_unloaded_module(tmp_path: Path) -> None:
-    """测试异步启动未加载的模块."""
-    manager = ModuleManager(tmp_path)
-
-    with pytest.raises(ModuleNotFoundError, match="未加载"):
-        await manager.start_async("nonexistent")
-
-
-def test_reload_without_loader(tmp_path: Path) -> None:
+def test_reload_without_loader() -> None:
     """测试在没有loader的情况下reload."""
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager.from_modules()
 
     # 手动设置loader为None
     manager._loader = None  # type: ignore
 
-    # reload应该抛出错误或安全处理
-    with pytest.raises((AttributeError, Exception)):
-        manager.reload()
+    # ModuleManager 没有 reload 方法
+    with pytest.raises(AttributeError, match="reload"):
+        manager.reload()  # type: ignore[attr-defined]
 
 
-def test_start_all_with_some_failures(tmp_path: Path) -> None:
+def test_start_all_with_some_failures(module_dir: ModuleDirFactory) -> None:
     """测试批量启动时部分模块失败."""
-    # 创建多个模块，其中一个会失败
-    (tmp_path / "good1.py").write_text(
-        """
-from symphra_modules import Module
-
-class GoodModule1(Module):
-    name = "good1"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-"""
-    )
-
-    (tmp_path / "bad.py").write_text(
-        """
-from symphra_modules import Module
-
-class BadModule(Module):
-    name = "bad"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        raise RuntimeError("Start failed")
-"""
-    )
-
-    (tmp_path / "good2.py").write_text(
-        """
-from symphra_modules import Module
-
-class GoodModule2(Module):
-    name = "good2"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"good1": GOOD1_SRC, "bad": BAD_SRC, "good2": GOOD2_SRC}))
     manager.load_all()
 
     # start_all应该记录错误但不抛异常
@@ -199,20 +177,9 @@ class GoodModule2(Module):
     assert bad.state != ModuleState.STARTED
 
 
-def test_disable_without_state_store(tmp_path: Path) -> None:
+def test_disable_without_state_store(module_dir: ModuleDirFactory) -> None:
     """测试在没有state_store的情况下disable模块."""
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test": TEMPLATE_BARE}))
     manager.load("test")
 
     # disable应该正常工作即使没有state_store
@@ -223,20 +190,9 @@ class TestModule(Module):
     assert module.state == ModuleState.DISABLED
 
 
-def test_enable_disabled_module_without_state_store(tmp_path: Path) -> None:
+def test_enable_disabled_module_without_state_store(module_dir: ModuleDirFactory) -> None:
     """测试在没有state_store的情况下enable模块."""
-    (tmp_path / "test.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test": TEMPLATE_BARE}))
     manager.load("test")
     manager.disable("test")
 
@@ -248,49 +204,9 @@ class TestModule(Module):
     assert module.state == ModuleState.INSTALLED
 
 
-def test_get_module_info_nonexistent_module(tmp_path: Path) -> None:
-    """测试获取不存在模块的信息."""
-    manager = ModuleManager(tmp_path)
-
-    # get_module_info对于不存在的模块会抛出ModuleNotFoundError
-    with pytest.raises(ModuleNotFoundError, match="模块不存在"):
-        manager.get_module_info("nonexistent")
-
-
-def test_list_started_modules_with_stopped_modules(tmp_path: Path) -> None:
+def test_list_started_modules_with_stopped_modules() -> None:
     """测试列出已启动模块（包含已停止的模块）."""
-    (tmp_path / "test1.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule1(Module):
-    name = "test1"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-
-    def stop(self):
-        pass
-"""
-    )
-
-    (tmp_path / "test2.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule2(Module):
-    name = "test2"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager.from_modules([FirstModule, SecondModule])
     manager.load_all()
     manager.start_all()
 
@@ -303,9 +219,9 @@ class TestModule2(Module):
     assert "test1" not in started
 
 
-def test_validate_module_name_with_special_chars(tmp_path: Path) -> None:
+def test_validate_module_name_with_special_chars() -> None:
     """测试包含特殊字符的模块名验证."""
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager.from_modules()
 
     # 测试包含路径分隔符
     with pytest.raises(ValueError, match="包含非法字符"):
@@ -320,32 +236,10 @@ def test_validate_module_name_with_special_chars(tmp_path: Path) -> None:
         manager.load("test module")
 
 
-@pytest.mark.asyncio
-async def test_load_all_async_with_ignored_modules(tmp_path: Path) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_load_all_async_with_ignored_modules(module_dir: ModuleDirFactory) -> None:
     """测试异步加载所有模块，包含被忽略的模块."""
-    (tmp_path / "test1.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule1(Module):
-    name = "test1"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    (tmp_path / "test2.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule2(Module):
-    name = "test2"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test1": TEST1_SRC, "test2": TEST2_SRC}))
 
     # 忽略一个模块
     manager.ignore_module("test1")
@@ -358,37 +252,9 @@ class TestModule2(Module):
     assert "test1" not in modules
 
 
-def test_bootstrap_with_dependencies(tmp_path: Path) -> None:
+def test_bootstrap_with_dependencies(module_dir: ModuleDirFactory) -> None:
     """测试bootstrap有依赖的模块."""
-    (tmp_path / "base.py").write_text(
-        """
-from symphra_modules import Module
-
-class BaseModule(Module):
-    name = "base"
-    version = "1.0.0"
-    dependencies = []
-
-    def bootstrap(self):
-        pass
-"""
-    )
-
-    (tmp_path / "dependent.py").write_text(
-        """
-from symphra_modules import Module
-
-class DependentModule(Module):
-    name = "dependent"
-    version = "1.0.0"
-    dependencies = ["base"]
-
-    def bootstrap(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"base": BASE_SRC, "dependent": DEPENDENT_SRC}))
     manager.load_all()
 
     # Bootstrap依赖模块
@@ -7,65 +7,45 @@
 - ignore_module, unignore_module
 """
 
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import pytest
 
-from symphra_modules import Module, ModuleManager
+from symphra_modules import ModuleManager
 from symphra_modules.core import FileStateStore, ModuleState
-from symphra_modules.core.exceptions import ModuleNotFoundError
 
+from ._fixture_modules import BODY_START, BODY_STOP, build_module_source
 
-class TestModule(Module):
-    """测试模块."""
+if TYPE_CHECKING:
+    from pathlib import Path
 
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
+    from .conftest import ModuleDirFactory
 
-    def __init__(self) -> None:
-        """初始化."""
-        super().__init__()
-        self.started = False
-        self.stopped = False
-        self.bootstrapped = False
+pytestmark = pytest.mark.xdist_group("manager_fs")
 
-    def bootstrap(self) -> None:
-        """Bootstrap."""
-        self.bootstrapped = True
+# 测试模块源码（模块级常量，各测试共享）
+TEST_MODULE_SRC = build_module_source("test_module")
+BOOTSTRAP_SRC = build_module_source(
+    "test_module",
+    "\n    def __init__(self):\n        super().__init__()\n        self.bootstrapped = False\n"
+    "\n    def bootstrap(self):\n        self.bootstrapped = True\n",
+)
+START_STOP_SRC = build_module_source("test_module", BODY_START + BODY_STOP)
+MODULE1_SRC = build_module_source("module1")
+MODULE2_SRC = build_module_source("module2")
 
-    def start(self) -> None:
-        """启动."""
-        self.started = True
 
-    def stop(self) -> None:
-        """停止."""
-        self.stopped = True
+@pytest.fixture
+def manager(module_dir: ModuleDirFactory) -> ModuleManager:
+    """只包含 test_module 的管理器（每个测试独立，模块目录在会话内共享）."""
+    return ModuleManager(module_dir({"test_module": TEST_MODULE_SRC}))
 
 
-def test_bootstrap_module(tmp_path: Path) -> None:
+def test_bootstrap_module(module_dir: ModuleDirFactory) -> None:
     """测试 bootstrap 模块."""
-    # 创建测试模块文件
-    module_file = tmp_path / "test_module.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-
-    def __init__(self):
-        super().__init__()
-        self.bootstrapped = False
-
-    def bootstrap(self):
-        self.bootstrapped = True
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test_module": BOOTSTRAP_SRC}))
     module = manager.load("test_module")
 
     # Bootstrap 模块
@@ -76,30 +56,8 @@ class TestModule(Module):
     assert module.bootstrapped  # type: ignore
 
 
-def test_bootstrap_nonexistent_module(tmp_path: Path) -> None:
-    """测试 bootstrap 不存在的模块."""
-    manager = ModuleManager(tmp_path)
-
-    with pytest.raises(ModuleNotFoundError):
-        manager.bootstrap("nonexistent")
-
-
-def test_install_module(tmp_path: Path) -> None:
+def test_install_module(manager: ModuleManager) -> None:
     """测试安装模块."""
-    module_file = tmp_path / "test_module.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
-
     # 安装模块（会自动加载）
     manager.install("test_module")
 
@@ -109,29 +67,8 @@ class TestModule(Module):
     assert module.state in [ModuleState.LOADED, ModuleState.INSTALLED]
 
 
-def test_install_nonexistent_module(tmp_path: Path) -> None:
-    """测试安装不存在的模块."""
-    manager = ModuleManager(tmp_path)
-
-    with pytest.raises(ModuleNotFoundError):
-        manager.install("nonexistent")
-
-
-def test_uninstall_module(tmp_path: Path) -> None:
+def test_uninstall_module(manager: ModuleManager) -> None:
     """测试卸载模块."""
-    module_file = tmp_path / "test_module.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
     manager.load("test_module")
 
     # 卸载模块
@@ -141,27 +78,9 @@ class TestModule(Module):
     assert manager.get_module("test_module") is None
 
 
-def test_uninstall_running_module(tmp_path: Path) -> None:
+def test_uninstall_running_module(module_dir: ModuleDirFactory) -> None:
     """测试卸载正在运行的模块（应该先停止）."""
-    module_file = tmp_path / "test_module.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-
-    def stop(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test_module": START_STOP_SRC}))
     manager.load("test_module")
     manager.start("test_module")
 
@@ -172,21 +91,8 @@ class TestModule(Module):
     assert manager.get_module("test_module") is None
 
 
-def test_disable_module(tmp_path: Path) -> None:
+def test_disable_module(manager: ModuleManager) -> None:
     """测试禁用模块."""
-    module_file = tmp_path / "test_module.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
     module = manager.load("test_module")
 
     # 禁用模块
@@ -196,27 +102,9 @@ class TestModule(Module):
     assert module.state == ModuleState.DISABLED
 
 
-def test_disable_running_module(tmp_path: Path) -> None:
+def test_disable_running_module(module_dir: ModuleDirFactory) -> None:
     """测试禁用正在运行的模块（应该先停止）."""
-    module_file = tmp_path / "test_module.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-
-    def stop(self):
-        pass
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test_module": START_STOP_SRC}))
     module = manager.load("test_module")
     manager.start("test_module")
 
@@ -227,21 +115,8 @@ class TestModule(Module):
     assert module.state == ModuleState.DISABLED
 
 
-def test_enable_disabled_module(tmp_path: Path) -> None:
+def test_enable_disabled_module(manager: ModuleManager) -> None:
     """测试启用被禁用的模块."""
-    module_file = tmp_path / "test_module.py"
-    module_file.write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
     module = manager.load("test_module")
 
     # 先禁用
@@ -253,31 +128,9 @@ class TestModule(Module):
     assert module.state == ModuleState.INSTALLED
 
 
-def test_ignore_module(tmp_path: Path) -> None:
+def test_ignore_module(module_dir: ModuleDirFactory) -> None:
     """测试忽略模块."""
-    # 创建两个模块
-    (tmp_path / "module1.py").write_text(
-        """
-from symphra_modules import Module
-
-class Module1(Module):
-    name = "module1"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-    (tmp_path / "module2.py").write_text(
-        """
-from symphra_modules import Module
-
-class Module2(Module):
-    name = "module2"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"module1": MODULE1_SRC, "module2": MODULE2_SRC}))
 
     # 初始应该发现两个模块
     assert len(manager.list_modules()) == 2
@@ -292,20 +145,9 @@ class Module2(Module):
     assert "module1" not in modules
 
 
-def test_unignore_module(tmp_path: Path) -> None:
+def test_unignore_module(module_dir: ModuleDirFactory) -> None:
     """测试取消忽略模块."""
-    (tmp_path / "test_module.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
-
-    manager = ModuleManager(tmp_path)
+    manager = ModuleManager(module_dir({"test_module": TEST_MODULE_SRC}))
 
     # 先忽略
     manager.ignore_module("test_module")
@@ -318,31 +160,19 @@ class TestModule(Module):
     assert "test_module" in manager.list_modules()
 
 
-def test_ignored_modules_with_state_store(tmp_path: Path) -> None:
+def test_ignored_modules_with_state_store(tmp_path: Path, module_dir: ModuleDirFactory) -> None:
     """测试忽略模块列表的持久化."""
     state_file = tmp_path / "states.json"
-    module_dir = tmp_path / "modules"
-    module_dir.mkdir()
-
-    (module_dir / "test_module.py").write_text(
-        """
-from symphra_modules import Module
-
-class TestModule(Module):
-    name = "test_module"
-    version = "1.0.0"
-    dependencies = []
-"""
-    )
+    directory = module_dir({"test_module": TEST_MODULE_SRC})
 
     # 第一个管理器忽略模块
     store1 = FileStateStore(state_file)
-    manager1 = ModuleManager(module_dir, state_store=store1)
+    manager1 = ModuleManager(directory, state_store=store1)
     manager1.ignore_module("test_module")
 
     # 第二个管理器应该自动加载忽略列表
     store2 = FileStateStore(state_file)
-    manager2 = ModuleManager(module_dir, state_store=store2)
+    manager2 = ModuleManager(directory, state_store=store2)
 
     # 验证模块仍然被忽略
     assert "test_module" not in manager2.list_modules()
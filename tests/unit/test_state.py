@@ -8,10 +8,27 @@ import pytest
 from symphra_modules import ModuleState
 from symphra_modules.core.state import get_state_description, is_valid_transition, VALID_TRANSITIONS
 
+# 所有状态（模块级构建一次，各测试共享）
+ALL_STATES = tuple(ModuleState)
+
 
 class TestStateTransitions:
     """测试状态转换."""
 
+    def test_module_state_enum(self) -> None:
+        """测试状态枚举成员及其取值（一次字典比较）."""
+        expected = {
+            "DISCOVERED": "discovered",
+            "INSTALLED": "installed",
+            "DISABLED": "disabled",
+            "INITIALIZED": "initialized",
+            "LOADED": "loaded",
+            "STARTED": "started",
+            "STOPPED": "stopped",
+            "UNINSTALLED": "uninstalled",
+        }
+        assert {state.name: state.value for state in ModuleState} == expected
+
     def test_get_state_description(self) -> None:
         """测试获取状态描述."""
         desc = get_state_description(ModuleState.LOADED)
@@ -43,7 +60,7 @@ class TestStateTransitions:
     def test_terminal_state(self) -> None:
         """测试终态（UNINSTALLED）."""
         # UNINSTALLED 是终态，不能转换到其他状态
-        for state in ModuleState:
+        for state in ALL_STATES:
             if state != ModuleState.UNINSTALLED:
                 assert not is_valid_transition(ModuleState.UNINSTALLED, state)
 
@@ -60,13 +77,34 @@ class TestStateTransitions:
     def test_state_transitions_completeness(self) -> None:
         """测试状态转换规则的完整性."""
         # 验证所有状态都在转换表中
-        for state in ModuleState:
-            assert state in VALID_TRANSITIONS
-
-        # 验证所有转换目标也是有效状态
-        for source, targets in VALID_TRANSITIONS.items():
-            for target in targets:
-                assert isinstance(target, ModuleState)
+        assert set(ALL_STATES) <= VALID_TRANSITIONS.keys()
+
+        # 验证所有转换目标也是有效状态（一次子集比较）
+        all_targets = {target for targets in VALID_TRANSITIONS.values() for target in targets}
+        assert all_targets <= set(ALL_STATES)
+
+    def test_transition_table_matches_is_valid_transition(self) -> None:
+        """测试 is_valid_transition 与转换表对所有状态对的结果一致."""
+        mismatched = [
+            (source, target)
+            for source in ALL_STATES
+            for target in ALL_STATES
+            if is_valid_transition(source, target) != (target in VALID_TRANSITIONS[source])
+        ]
+        assert not mismatched
+        assert all(type(targets) is frozenset for targets in VALID_TRANSITIONS.values())
+
+    @pytest.mark.parametrize(
+        ("from_state", "to_state"),
+        [
+            pytest.param("loaded", ModuleState.STARTED, id="unknown_source"),
+            pytest.param(ModuleState.LOADED, "started", id="unknown_target"),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    def test_unknown_state_is_invalid(self, from_state: object, to_state: object) -> None:
+        """测试非 ModuleState 的输入返回 False 而不是抛出异常."""
+        assert not is_valid_transition(from_state, to_state)  # type: ignore[arg-type]
 
     def test_discovered_to_installed(self) -> None:
         """测试DISCOVERED到INSTALLED的转换."""
@@ -108,21 +146,8 @@ class TestStateTransitions:
 
     def test_any_to_uninstalled(self) -> None:
         """测试从有效状态转换到UNINSTALLED（终态）."""
-        # 只有INSTALLED和DISABLED可以转换到UNINSTALLED
-        valid_sources = [
-            ModuleState.INSTALLED,
-            ModuleState.DISABLED,
-        ]
-
-        for state in valid_sources:
-            assert is_valid_transition(state, ModuleState.UNINSTALLED)
-
-        # 其他状态不能直接转换到UNINSTALLED
-        invalid_sources = [
-            ModuleState.LOADED,
-            ModuleState.STARTED,
-            ModuleState.STOPPED,
-        ]
-
-        for state in invalid_sources:
-            assert not is_valid_transition(state, ModuleState.UNINSTALLED)
+        # 只有INSTALLED和DISABLED可以转换到UNINSTALLED，其他状态都不能直接转换
+        valid_sources = {
+            state for state in ALL_STATES if is_valid_transition(state, ModuleState.UNINSTALLED)
+        }
+        assert valid_sources == {ModuleState.INSTALLED, ModuleState.DISABLED}
@@ -1,127 +1,27 @@
 """测试模块状态管理功能."""
 
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import pytest
 
 from symphra_modules import ModuleManager
 from symphra_modules.core import (
     FileStateStore,
-    Module,
     ModuleNotFoundError,
     ModuleState,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
 
-# 测试模块定义
-class SimpleModule(Module):
-    """简单测试模块."""
-
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.bootstrapped = False
-        self.started = False
-
-    def bootstrap(self) -> None:
-        """Bootstrap 初始化."""
-        self.bootstrapped = True
-
-    def start(self) -> None:
-        """启动模块."""
-        self.started = True
-
-    def stop(self) -> None:
-        """停止模块."""
-        self.started = False
-
-
-class DependentModule(Module):
-    """有依赖的测试模块."""
-
-    name = "dependent"
-    version = "1.0.0"
-    dependencies = ["simple"]
-
-    def start(self) -> None:
-        """启动模块."""
-        pass
-
-    def stop(self) -> None:
-        """停止模块."""
-        pass
-
-
-class TestBootstrap:
-    """测试 Bootstrap 功能."""
-
-    def test_bootstrap_module(self, tmp_path: Path) -> None:
-        """测试 bootstrap 模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-
-    def __init__(self):
-        super().__init__()
-        self.bootstrapped = False
-        self.started = False
-
-    def bootstrap(self):
-        self.bootstrapped = True
-
-    def start(self):
-        self.started = True
-
-    def stop(self):
-        self.started = False
-"""
-        )
-
-        # 创建管理器并加载模块
-        manager = ModuleManager(modules_dir)
-        manager.load("simple")
-
-        # Bootstrap 模块
-        manager.bootstrap("simple")
-
-        # 验证状态
-        module = manager.get_module("simple")
-        assert module is not None
-        assert module.state == ModuleState.INITIALIZED
-        assert module.bootstrapped is True
-        assert module.started is False
-
-    def test_bootstrap_without_load(self, tmp_path: Path) -> None:
-        """测试在未加载模块时 bootstrap 应该失败."""
-        manager = ModuleManager(tmp_path)
-
-        with pytest.raises(ModuleNotFoundError):
-            manager.bootstrap("nonexistent")
+    from .conftest import ModuleDirFactory
 
-    def test_bootstrap_then_start(self, tmp_path: Path) -> None:
-        """测试 bootstrap 后可以启动模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
+pytestmark = pytest.mark.xdist_group("manager_fs")
 
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
+# 测试模块源码：包含 bootstrap/start/stop，覆盖本文件所有测试需要的行为
+SIMPLE_SRC = """
 from symphra_modules.core import Module
 
 class SimpleModule(Module):
@@ -143,274 +43,98 @@ class SimpleModule(Module):
     def stop(self):
         self.started = False
 """
-        )
-
-        # 创建管理器并加载模块
-        manager = ModuleManager(modules_dir)
-        manager.load("simple")
-        manager.bootstrap("simple")
-
-        # 启动模块
-        manager.start("simple")
-
-        # 验证状态
-        module = manager.get_module("simple")
-        assert module is not None
-        assert module.state == ModuleState.STARTED
-        assert module.bootstrapped is True
-        assert module.started is True
-
-
-class TestInstallUninstall:
-    """测试安装/卸载功能."""
-
-    def test_install_module(self, tmp_path: Path) -> None:
-        """测试安装模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-        )
-
-        # 创建管理器
-        manager = ModuleManager(modules_dir)
-
-        # 安装模块（会自动加载）
-        manager.install("simple")
-
-        # 验证模块已安装
-        module = manager.get_module("simple")
-        assert module is not None
-        assert module.state in [ModuleState.INSTALLED, ModuleState.LOADED]
-
-    def test_uninstall_module(self, tmp_path: Path) -> None:
-        """测试卸载模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-        )
-
-        # 创建管理器并加载模块
-        manager = ModuleManager(modules_dir)
-        manager.load("simple")
-
-        # 卸载模块
-        manager.uninstall("simple")
-
-        # 验证模块已卸载
-        module = manager.get_module("simple")
-        assert module is None
-
-    def test_uninstall_running_module(self, tmp_path: Path) -> None:
-        """测试卸载正在运行的模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-
-    def start(self):
-        pass
-
-    def stop(self):
-        pass
-"""
-        )
-
-        # 创建管理器并加载、启动模块
-        manager = ModuleManager(modules_dir)
-        manager.load("simple")
-        manager.start("simple")
-
-        # 验证模块正在运行
-        module = manager.get_module("simple")
-        assert module is not None
-        assert module.state == ModuleState.STARTED
-
-        # 卸载模块（应该先停止再卸载）
-        manager.uninstall("simple")
-
-        # 验证模块已卸载
-        module = manager.get_module("simple")
-        assert module is None
-
 
-class TestEnableDisable:
-    """测试启用/禁用功能."""
 
-    def test_disable_module(self, tmp_path: Path) -> None:
-        """测试禁用模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
+@pytest.fixture(scope="session")
+def simple_modules_dir(module_dir: ModuleDirFactory) -> Path:
+    """只包含 simple_module.py 的只读模块目录（整个测试会话只写入一次）.
 
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
+    模块状态保存在各测试自己的 ModuleManager 中，因此共享目录不影响隔离。
+    """
+    return module_dir({"simple_module": SIMPLE_SRC})
 
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
 
-    def stop(self):
-        pass
-"""
-        )
-
-        # 创建管理器并加载模块
-        manager = ModuleManager(modules_dir)
-        manager.load("simple")
-
-        # 禁用模块
-        manager.disable("simple")
-
-        # 验证模块已禁用
-        module = manager.get_module("simple")
-        assert module is not None
-        assert module.state == ModuleState.DISABLED
-
-    def test_disable_running_module(self, tmp_path: Path) -> None:
-        """测试禁用正在运行的模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
+@pytest.fixture
+def manager(simple_modules_dir: Path) -> ModuleManager:
+    """基于 simple_modules_dir 的默认配置管理器（每个测试独立）."""
+    return ModuleManager(simple_modules_dir)
 
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
 
-    def start(self):
-        pass
+class TestBootstrap:
+    """测试 Bootstrap 功能."""
 
-    def stop(self):
-        pass
-"""
-        )
+    def test_bootstrap_without_load(self) -> None:
+        """测试在未加载模块时 bootstrap 应该失败."""
+        manager = ModuleManager.from_modules()
 
-        # 创建管理器并加载、启动模块
-        manager = ModuleManager(modules_dir)
-        manager.load("simple")
-        manager.start("simple")
+        with pytest.raises(ModuleNotFoundError):
+            manager.bootstrap("nonexistent")
 
-        # 验证模块正在运行
-        module = manager.get_module("simple")
-        assert module is not None
-        assert module.state == ModuleState.STARTED
 
-        # 禁用模块（应该先停止再禁用）
-        manager.disable("simple")
+class TestOperationSequences:
+    """测试 bootstrap/install/uninstall/enable/disable 操作序列后的模块状态."""
+
+    @pytest.mark.parametrize(
+        ("operations", "expected_states", "expected_attrs"),
+        [
+            pytest.param(
+                ("load", "bootstrap"),
+                (ModuleState.INITIALIZED,),
+                {"bootstrapped": True, "started": False},
+                id="bootstrap",
+            ),
+            pytest.param(
+                ("load", "bootstrap", "start"),
+                (ModuleState.STARTED,),
+                {"bootstrapped": True, "started": True},
+                id="bootstrap_then_start",
+            ),
+            # install 在没有实例时直接加载模块
+            pytest.param(
+                ("install",), (ModuleState.INSTALLED, ModuleState.LOADED), {}, id="install"
+            ),
+            pytest.param(("load", "uninstall"), None, {}, id="uninstall"),
+            # 卸载/禁用运行中的模块时应先停止
+            pytest.param(("load", "start", "uninstall"), None, {}, id="uninstall_running"),
+            pytest.param(("load", "disable"), (ModuleState.DISABLED,), {}, id="disable"),
+            pytest.param(
+                ("load", "start", "disable"),
+                (ModuleState.DISABLED,),
+                {"started": False},
+                id="disable_running",
+            ),
+            pytest.param(
+                ("load", "disable", "enable"), (ModuleState.INSTALLED,), {}, id="enable_disabled"
+            ),
+        ],
+    )
+    def test_operation_sequence(
+        self,
+        manager: ModuleManager,
+        operations: tuple[str, ...],
+        expected_states: tuple[ModuleState, ...] | None,
+        expected_attrs: dict[str, bool],
+    ) -> None:
+        """依次执行操作后验证最终状态（None 表示模块实例已移除）."""
+        for operation in operations:
+            getattr(manager, operation)("simple")
 
-        # 验证模块已禁用
         module = manager.get_module("simple")
-        assert module is not None
-        assert module.state == ModuleState.DISABLED
-
-    def test_enable_disabled_module(self, tmp_path: Path) -> None:
-        """测试启用已禁用的模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-
-    def stop(self):
-        pass
-"""
-        )
-
-        # 创建管理器并加载模块
-        manager = ModuleManager(modules_dir)
-        manager.load("simple")
-
-        # 禁用模块
-        manager.disable("simple")
-        assert manager.get_module("simple").state == ModuleState.DISABLED  # type: ignore
+        if expected_states is None:
+            assert module is None
+            return
 
-        # 启用模块
-        manager.enable("simple")
-
-        # 验证模块已启用
-        module = manager.get_module("simple")
         assert module is not None
-        assert module.state == ModuleState.INSTALLED
+        assert module.state in expected_states
+        for attr, value in expected_attrs.items():
+            assert getattr(module, attr) is value
 
 
 class TestIgnoreModule:
     """测试忽略模块功能."""
 
-    def test_ignore_module(self, tmp_path: Path) -> None:
+    def test_ignore_module(self, manager: ModuleManager) -> None:
         """测试忽略模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-        )
-
-        # 创建管理器
-        manager = ModuleManager(modules_dir)
-
         # 验证模块在可用列表中
         assert "simple" in manager.list_modules()
 
@@ -420,27 +144,17 @@ class SimpleModule(Module):
         # 验证模块不在可用列表中
         assert "simple" not in manager.list_modules()
 
-    def test_unignore_module(self, tmp_path: Path) -> None:
-        """测试取消忽略模块."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
+    def test_list_modules_returns_copy(self, manager: ModuleManager) -> None:
+        """测试 list_modules 返回副本，修改结果不影响缓存."""
+        modules = manager.list_modules()
+        modules.clear()
 
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-        )
+        assert manager.list_modules() == ["simple"]
 
+    def test_unignore_module(self, simple_modules_dir: Path) -> None:
+        """测试取消忽略模块."""
         # 创建管理器并忽略模块
-        manager = ModuleManager(modules_dir, ignored_modules={"simple"})
+        manager = ModuleManager(simple_modules_dir, ignored_modules={"simple"})
 
         # 验证模块不在可用列表中
         assert "simple" not in manager.list_modules()
@@ -451,35 +165,20 @@ class SimpleModule(Module):
         # 验证模块在可用列表中
         assert "simple" in manager.list_modules()
 
-    def test_ignored_modules_with_state_store(self, tmp_path: Path) -> None:
+    def test_ignored_modules_with_state_store(
+        self, tmp_path: Path, simple_modules_dir: Path
+    ) -> None:
         """测试忽略模块列表持久化."""
-        # 创建测试模块目录
-        modules_dir = tmp_path / "modules"
-        modules_dir.mkdir()
-
-        # 创建测试模块文件
-        module_file = modules_dir / "simple_module.py"
-        module_file.write_text(
-            """
-from symphra_modules.core import Module
-
-class SimpleModule(Module):
-    name = "simple"
-    version = "1.0.0"
-    dependencies = []
-"""
-        )
-
         # 创建状态存储
         state_file = tmp_path / "states.json"
         store = FileStateStore(state_file)
 
         # 第一个管理器忽略模块
-        manager1 = ModuleManager(modules_dir, state_store=store)
+        manager1 = ModuleManager(simple_modules_dir, state_store=store)
         manager1.ignore_module("simple")
 
         # 第二个管理器加载相同的状态存储
-        manager2 = ModuleManager(modules_dir, state_store=store)
+        manager2 = ModuleManager(simple_modules_dir, state_store=store)
 
         # 验证模块在第二个管理器中也被忽略
         assert "simple" not in manager2.list_modules()